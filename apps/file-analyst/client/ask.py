@@ -9,14 +9,23 @@ Usage:
     python apps/file-analyst/client/ask.py "What security issues were found?"
 """
 
+import http.client
 import sys
-import json
-import urllib.request
-import urllib.error
+import urllib.parse
+
+from pydantic_core import from_json, to_json
 
 DOMEKIT_URL = "http://localhost:8080/v1/chat/completions"
 MODEL = "llama3.1:8b"
 
+# Parse the endpoint once; the connection itself is opened lazily and kept alive.
+_URL = urllib.parse.urlsplit(DOMEKIT_URL)
+_HOST = _URL.hostname or "localhost"
+_PORT = _URL.port or 80
+_PATH = _URL.path or "/"
+_HEADERS = {"Content-Type": "application/json", "Connection": "keep-alive"}
+_CONN: http.client.HTTPConnection | None = None
+
 SYSTEM_PROMPT = (
     "You are a file analyst agent. You can search for files using the sql_query tool "
     "against the index database, and read file contents using the read_file tool. "
@@ -24,34 +33,56 @@ SYSTEM_PROMPT = (
     "Answer questions based on the contents of the available reports."
 )
 
+# Request template built once; ask() only swaps in the user's question.
+_USER_MESSAGE = {"role": "user", "content": ""}
+_PAYLOAD = {
+    "model": MODEL,
+    "messages": [{"role": "system", "content": SYSTEM_PROMPT}, _USER_MESSAGE],
+}
+
+
+def _send(data: bytes) -> tuple[int, bytes]:
+    global _CONN
+    if _CONN is None:
+        _CONN = http.client.HTTPConnection(_HOST, _PORT)
+    _CONN.request("POST", _PATH, body=data, headers=_HEADERS)
+    resp = _CONN.getresponse()
+    return resp.status, resp.read()
+
+
+def _post(data: bytes) -> tuple[int, bytes]:
+    """POST *data* over the shared keep-alive connection, reconnecting once if dropped."""
+    global _CONN
+    try:
+        return _send(data)
+    except (ConnectionResetError, http.client.RemoteDisconnected):
+        if _CONN is not None:
+            _CONN.close()
+        _CONN = None
+        return _send(data)
+
 
 def ask(question: str) -> None:
-    payload = {
-        "model": MODEL,
-        "messages": [
-            {"role": "system", "content": SYSTEM_PROMPT},
-            {"role": "user", "content": question},
-        ],
-    }
-
-    data = json.dumps(payload).encode("utf-8")
-    req = urllib.request.Request(
-        DOMEKIT_URL,
-        data=data,
-        headers={"Content-Type": "application/json"},
-    )
+    _USER_MESSAGE["content"] = question
+    data = to_json(_PAYLOAD)
 
     try:
-        with urllib.request.urlopen(req) as resp:
-            body = json.loads(resp.read().decode("utf-8"))
-            message = body["choices"][0]["message"]["content"]
-            print(message)
-    except urllib.error.URLError as exc:
+        status, raw = _post(data)
+    except (OSError, http.client.HTTPException) as exc:
         print(f"Error connecting to DomeKit at {DOMEKIT_URL}", file=sys.stderr)
         print(f"Is the runtime running? (domekit run --app apps/file-analyst)", file=sys.stderr)
         print(f"Details: {exc}", file=sys.stderr)
         sys.exit(1)
 
+    if status >= 400:
+        print(f"Error: HTTP {status} from {DOMEKIT_URL}", file=sys.stderr)
+        print(raw.decode("utf-8", errors="replace"), file=sys.stderr)
+        sys.exit(1)
+
+    body = from_json(raw)
+    message = body["choices"][0]["message"]["content"]
+    print(message)
+
 
 def main() -> None:
     if len(sys.argv) < 2:
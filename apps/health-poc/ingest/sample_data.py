@@ -2,16 +2,37 @@
 
 from __future__ import annotations
 
-import csv
 import os
 import random
 from datetime import date, timedelta
 from pathlib import Path
+from typing import Callable
 
 DATA_DIR = Path(__file__).resolve().parent.parent / "data"
 
 ACTIVITY_TYPES = ["running", "cycling", "walking", "swimming"]
 
+ACTIVITY_FIELDS = (
+    "date",
+    "type",
+    "duration_min",
+    "distance_km",
+    "avg_hr",
+    "calories",
+)
+# Bound str.format per table: one call renders a whole row.
+format_activity_row = "{},{},{},{},{},{}\n".format
+
+DAILY_METRIC_FIELDS = (
+    "date",
+    "steps",
+    "resting_hr",
+    "sleep_hours",
+    "active_minutes",
+    "stress_score",
+)
+format_daily_metric_row = "{},{},{},{:.1f},{},{}\n".format
+
 # Rough per-activity parameter ranges
 ACTIVITY_PARAMS: dict[str, dict] = {
     "running": {
@@ -41,63 +62,70 @@ ACTIVITY_PARAMS: dict[str, dict] = {
 }
 
 
+# ACTIVITY_PARAMS split into per-field tables, indexed like ACTIVITY_TYPES
+_DURATION = tuple(ACTIVITY_PARAMS[t]["duration"] for t in ACTIVITY_TYPES)
+_DISTANCE = tuple(ACTIVITY_PARAMS[t]["distance"] for t in ACTIVITY_TYPES)
+_HR = tuple(ACTIVITY_PARAMS[t]["hr"] for t in ACTIVITY_TYPES)
+_CAL_PER_MIN = tuple(ACTIVITY_PARAMS[t]["cal_per_min"] for t in ACTIVITY_TYPES)
+
+
 def _rand(low: float, high: float) -> float:
     return round(random.uniform(low, high), 2)
 
 
-def generate_activities(start: date, days: int) -> list[dict]:
-    """Generate activity records.  ~4-6 activities per week."""
-    rows: list[dict] = []
-    for offset in range(days):
-        day = start + timedelta(days=offset)
-        # Randomly decide how many activities today (0-2, weighted toward 1)
-        count = random.choices([0, 1, 2], weights=[0.3, 0.55, 0.15])[0]
-        for _ in range(count):
-            atype = random.choice(ACTIVITY_TYPES)
-            p = ACTIVITY_PARAMS[atype]
-            duration = round(_rand(*p["duration"]))
-            distance = _rand(*p["distance"])
-            avg_hr = round(_rand(*p["hr"]))
-            calories = round(duration * _rand(*p["cal_per_min"]))
-            rows.append(
-                {
-                    "date": day.isoformat(),
-                    "type": atype,
-                    "duration_min": duration,
-                    "distance_km": distance,
-                    "avg_hr": avg_hr,
-                    "calories": calories,
-                }
-            )
-    return rows
-
-
-def generate_daily_metrics(start: date, days: int) -> list[dict]:
-    """Generate one row per day of daily health metrics."""
-    rows: list[dict] = []
-    for offset in range(days):
-        day = start + timedelta(days=offset)
-        rows.append(
-            {
-                "date": day.isoformat(),
-                "steps": random.randint(3000, 15000),
-                "resting_hr": random.randint(55, 75),
-                "sleep_hours": round(_rand(5.0, 9.5), 1),
-                "active_minutes": random.randint(15, 120),
-                "stress_score": random.randint(1, 10),
-            }
-        )
-    return rows
-
-
-def write_csv(path: Path, rows: list[dict]) -> None:
+def generate_activities(start: date, days: int) -> list[tuple]:
+    """Generate activity records in ACTIVITY_FIELDS order.  ~4-6 per week."""
+    # Draw how many activities each day gets (0-2, weighted toward 1) and the
+    # type of every activity up front, one bulk call each.
+    counts = random.choices([0, 1, 2], weights=[0.3, 0.55, 0.15], k=days)
+    dates = [
+        (start + timedelta(days=offset)).isoformat()
+        for offset, count in enumerate(counts)
+        for _ in range(count)
+    ]
+    idx = random.choices(range(len(ACTIVITY_TYPES)), k=len(dates))
+
+    # Each column is drawn in one pass, indexing the per-type range tables.
+    durations = [round(_rand(*_DURATION[i])) for i in idx]
+    distances = [_rand(*_DISTANCE[i]) for i in idx]
+    avg_hrs = [round(_rand(*_HR[i])) for i in idx]
+    calories = [round(d * _rand(*_CAL_PER_MIN[i])) for d, i in zip(durations, idx)]
+    types = [ACTIVITY_TYPES[i] for i in idx]
+    return list(zip(dates, types, durations, distances, avg_hrs, calories))
+
+
+def generate_daily_metrics(start: date, days: int) -> list[tuple]:
+    """Generate one row per day of daily health metrics, in DAILY_METRIC_FIELDS order."""
+    # Each column is drawn in a single bulk call, then zipped into rows.
+    columns = (
+        [(start + timedelta(days=offset)).isoformat() for offset in range(days)],
+        random.choices(range(3000, 15001), k=days),
+        random.choices(range(55, 76), k=days),
+        [round(_rand(5.0, 9.5), 1) for _ in range(days)],
+        random.choices(range(15, 121), k=days),
+        random.choices(range(1, 11), k=days),
+    )
+    return list(zip(*columns))
+
+
+def write_csv(
+    path: Path,
+    fieldnames: tuple[str, ...],
+    format_row: Callable[..., str],
+    rows: list[tuple],
+) -> None:
+    """Write *rows* as CSV, rendering each one with *format_row*.
+
+    All generated values are numbers, ISO dates or fixed activity names, so
+    no field ever needs csv quoting.
+    """
     if not rows:
         return
     path.parent.mkdir(parents=True, exist_ok=True)
-    with open(path, "w", newline="") as f:
-        writer = csv.DictWriter(f, fieldnames=list(rows[0].keys()))
-        writer.writeheader()
-        writer.writerows(rows)
+    lines = [",".join(fieldnames) + "\n"]
+    lines.extend(format_row(*row) for row in rows)
+    with open(path, "wb") as f:
+        f.write("".join(lines).encode("ascii"))
     print(f"Wrote {len(rows)} rows to {path}")
 
 
@@ -109,8 +137,8 @@ def main() -> None:
     activities = generate_activities(start, 90)
     daily = generate_daily_metrics(start, 90)
 
-    write_csv(DATA_DIR / "activities.csv", activities)
-    write_csv(DATA_DIR / "daily_metrics.csv", daily)
+    write_csv(DATA_DIR / "activities.csv", ACTIVITY_FIELDS, format_activity_row, activities)
+    write_csv(DATA_DIR / "daily_metrics.csv", DAILY_METRIC_FIELDS, format_daily_metric_row, daily)
     print("Sample data generation complete.")
 
 
@@ -6,20 +6,30 @@ Usage:
 
 from __future__ import annotations
 
-import json
+import atexit
 import sys
 from pathlib import Path
 
 import httpx
+from pydantic_core import from_json, to_json
 
 # Add project root so we can import shared contracts.
-PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent.parent
+PROJECT_ROOT = Path(__file__).parent.parent.parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
 from contracts.api import ChatRequest, Message, Role  # noqa: E402
 
 BASE_URL = "http://127.0.0.1:8080"
 
+# One pooled keep-alive client per process, reused across requests.
+_CLIENT = httpx.Client(
+    base_url=BASE_URL,
+    limits=httpx.Limits(max_keepalive_connections=4, max_connections=8),
+    timeout=60.0,
+    headers={"Content-Type": "application/json"},
+)
+atexit.register(_CLIENT.close)
+
 SYSTEM_PROMPT = (
     "You are a research data analyst. You have access to a SQLite database at "
     "apps/research-agent/data/research.db with the following tables:\n\n"
@@ -32,22 +42,31 @@ SYSTEM_PROMPT = (
     "Return concise, helpful answers. Flag any confidential findings clearly."
 )
 
-
-def ask(question: str) -> None:
-    """Send a question to the DomeKit runtime and print the response."""
-    request = ChatRequest(
+# Only the user's question varies between requests, so the rest of the
+# ChatRequest body is serialised once here.  The empty user content is the
+# last "" in the document; each request splices the question in its place.
+_BODY_PREFIX, _BODY_SUFFIX = (
+    ChatRequest(
         model="default",
         messages=[
             Message(role=Role.SYSTEM, content=SYSTEM_PROMPT),
-            Message(role=Role.USER, content=question),
+            Message(role=Role.USER, content=""),
         ],
     )
+    .model_dump_json()
+    .encode()
+    .rsplit(b'""', 1)
+)
+
+
+def ask(question: str) -> None:
+    """Send a question to the DomeKit runtime and print the response."""
+    body = _BODY_PREFIX + to_json(question) + _BODY_SUFFIX
 
     try:
-        resp = httpx.post(
-            f"{BASE_URL}/v1/chat/completions",
-            json=json.loads(request.model_dump_json()),
-            timeout=60.0,
+        resp = _CLIENT.post(
+            "/v1/chat/completions",
+            content=body,
         )
         resp.raise_for_status()
     except httpx.ConnectError:
@@ -59,7 +78,7 @@ def ask(question: str) -> None:
         print(exc.response.text)
         sys.exit(1)
 
-    data = resp.json()
+    data = from_json(resp.content)
 
     # Print the model's answer.
     answer = data.get("choices", [{}])[0].get("message", {}).get("content", "")
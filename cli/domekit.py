@@ -7,10 +7,6 @@ import json
 import sys
 from pathlib import Path
 
-# Ensure project root is importable when running as script
-PROJECT_ROOT = Path(__file__).resolve().parent.parent
-sys.path.insert(0, str(PROJECT_ROOT))
-
 
 def cmd_validate(args: argparse.Namespace) -> None:
     """Validate a domekit.yaml manifest."""
@@ -63,15 +59,22 @@ def cmd_run(args: argparse.Namespace) -> None:
     print(f"  Host:     {args.host}")
     print(f"  Port:     {args.port}")
     print(f"  Policy:   {manifest.runtime.policy_mode.value}")
+    if not args.reload:
+        print(f"  Workers:  {args.workers}")
     print()
 
     import uvicorn
 
+    # loop/http stay on "auto": uvicorn picks uvloop and httptools when they
+    # are installed and falls back to asyncio/h11 otherwise.
     uvicorn.run(
         "runtime.app:app",
         host=args.host,
         port=args.port,
         reload=args.reload,
+        workers=None if args.reload else args.workers,
+        loop="auto",
+        http="auto",
         log_level="info",
     )
 
@@ -106,57 +109,87 @@ def cmd_logs(args: argparse.Namespace) -> None:
         return
 
     for entry in entries:
-        record = json.loads(entry.model_dump_json())
         if args.json:
-            print(json.dumps(record))
+            print(entry.model_dump_json())
         else:
-            ts = record["ts"][:19]
-            event = record["event"]
-            rid = record["request_id"][:8]
-            detail = json.dumps(record.get("detail", {}))
-            print(f"{ts}  [{event:16s}]  {rid}  {detail}")
+            ts = entry.ts.isoformat()[:19]
+            rid = entry.request_id[:8]
+            # Entries come from the JSONL log, so detail is already JSON-native.
+            detail = json.dumps(entry.detail)
+            print(f"{ts}  [{entry.event.value:16s}]  {rid}  {detail}")
+
+
+# ── Argument parsing ────────────────────────────────────────────────
+
+
+def _add_validate_args(p: argparse.ArgumentParser) -> None:
+    p.add_argument(
+        "manifest", nargs="?", default="domekit.yaml", help="Path to manifest"
+    )
+
+
+def _add_run_args(p: argparse.ArgumentParser) -> None:
+    p.add_argument(
+        "manifest", nargs="?", default="domekit.yaml", help="Path to manifest"
+    )
+    p.add_argument("--host", default="127.0.0.1", help="Bind address")
+    p.add_argument("--port", type=int, default=8080, help="Port")
+    p.add_argument("--reload", action="store_true", help="Enable auto-reload")
+    p.add_argument(
+        "--workers", type=int, default=1, help="Worker processes (ignored with --reload)"
+    )
+
+
+def _add_logs_args(p: argparse.ArgumentParser) -> None:
+    p.add_argument("log_path", help="Path to audit JSONL file")
+    p.add_argument("--request-id", "-r", help="Filter by request ID")
+    p.add_argument("--event", "-e", help="Filter by event type")
+    p.add_argument("--limit", "-n", type=int, default=20, help="Max entries")
+    p.add_argument("--json", action="store_true", help="Output raw JSON")
+
+
+# name -> (help, argument builder, handler)
+_COMMANDS = {
+    "validate": ("Validate a domekit.yaml manifest", _add_validate_args, cmd_validate),
+    "run": ("Start the DomeKit runtime server", _add_run_args, cmd_run),
+    "logs": ("Query audit logs", _add_logs_args, cmd_logs),
+}
+
 
+def _build_parser(command: str | None) -> argparse.ArgumentParser:
+    """Build the CLI parser, registering arguments only for *command*.
 
-def main() -> None:
+    Every subcommand is listed so top-level ``--help`` stays complete, but
+    only the one actually being run pays for its argument setup.
+    """
     parser = argparse.ArgumentParser(
         prog="domekit",
         description="DomeKit — local-first AI runtime CLI",
     )
     sub = parser.add_subparsers(dest="command")
+    for name, (help_text, add_args, _) in _COMMANDS.items():
+        p = sub.add_parser(name, help=help_text)
+        if name == command:
+            add_args(p)
+    return parser
 
-    # validate
-    p_val = sub.add_parser("validate", help="Validate a domekit.yaml manifest")
-    p_val.add_argument(
-        "manifest", nargs="?", default="domekit.yaml", help="Path to manifest"
-    )
-    p_val.set_defaults(func=cmd_validate)
 
-    # run
-    p_run = sub.add_parser("run", help="Start the DomeKit runtime server")
-    p_run.add_argument(
-        "manifest", nargs="?", default="domekit.yaml", help="Path to manifest"
-    )
-    p_run.add_argument("--host", default="127.0.0.1", help="Bind address")
-    p_run.add_argument("--port", type=int, default=8080, help="Port")
-    p_run.add_argument("--reload", action="store_true", help="Enable auto-reload")
-    p_run.set_defaults(func=cmd_run)
-
-    # logs
-    p_logs = sub.add_parser("logs", help="Query audit logs")
-    p_logs.add_argument("log_path", help="Path to audit JSONL file")
-    p_logs.add_argument("--request-id", "-r", help="Filter by request ID")
-    p_logs.add_argument("--event", "-e", help="Filter by event type")
-    p_logs.add_argument("--limit", "-n", type=int, default=20, help="Max entries")
-    p_logs.add_argument("--json", action="store_true", help="Output raw JSON")
-    p_logs.set_defaults(func=cmd_logs)
-
-    args = parser.parse_args()
+def main(argv: list[str] | None = None) -> None:
+    argv = sys.argv[1:] if argv is None else argv
+    command = argv[0] if argv and argv[0] in _COMMANDS else None
+
+    parser = _build_parser(command)
+    args = parser.parse_args(argv)
     if not args.command:
         parser.print_help()
         sys.exit(1)
 
-    args.func(args)
+    _COMMANDS[args.command][2](args)
 
 
 if __name__ == "__main__":
+    # Ensure project root is importable when running as script; the installed
+    # `domekit` entry point already has it on sys.path.
+    PROJECT_ROOT = Path(__file__).resolve().parent.parent
+    sys.path.insert(0, str(PROJECT_ROOT))
     main()
@@ -1,10 +1,40 @@
 """Shared contracts — source of truth for all DomeKit interfaces."""
 
-from contracts.api import ChatRequest, ChatResponse, Choice, Message, Role, ToolCall, TraceMeta
-from contracts.manifest import Manifest, Policy, ModelsConfig, ToolConfig, AuditConfig
-from contracts.tool_sdk import BaseTool, ToolContext, ToolDefinition, ToolInput, ToolOutput
-from contracts.audit import AuditEntry, AuditEvent, AuditLogger
-from contracts.policy import PolicyDecision, PolicyEngine, PolicyVerdict
+import importlib
+from typing import Any
+
+# Re-exports resolve on first attribute access (PEP 562), so importing a
+# single submodule (e.g. ``contracts.audit``) doesn't load the whole surface.
+_LAZY: dict[str, str] = {
+    # api
+    "ChatRequest": "contracts.api",
+    "ChatResponse": "contracts.api",
+    "Choice": "contracts.api",
+    "Message": "contracts.api",
+    "Role": "contracts.api",
+    "ToolCall": "contracts.api",
+    "TraceMeta": "contracts.api",
+    # manifest
+    "Manifest": "contracts.manifest",
+    "Policy": "contracts.manifest",
+    "ModelsConfig": "contracts.manifest",
+    "ToolConfig": "contracts.manifest",
+    "AuditConfig": "contracts.manifest",
+    # tool sdk
+    "BaseTool": "contracts.tool_sdk",
+    "ToolContext": "contracts.tool_sdk",
+    "ToolDefinition": "contracts.tool_sdk",
+    "ToolInput": "contracts.tool_sdk",
+    "ToolOutput": "contracts.tool_sdk",
+    # audit
+    "AuditEntry": "contracts.audit",
+    "AuditEvent": "contracts.audit",
+    "AuditLogger": "contracts.audit",
+    # policy
+    "PolicyDecision": "contracts.policy",
+    "PolicyEngine": "contracts.policy",
+    "PolicyVerdict": "contracts.policy",
+}
 
 __all__ = [
     # api
@@ -36,3 +66,17 @@ __all__ = [
     "PolicyEngine",
     "PolicyVerdict",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
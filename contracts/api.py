@@ -5,7 +5,7 @@ from __future__ import annotations
 from enum import Enum
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class Role(str, Enum):
@@ -16,17 +16,23 @@ class Role(str, Enum):
 
 
 class ToolCallFunction(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     name: str
     arguments: str  # JSON-encoded string
 
 
 class ToolCall(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     id: str
     type: str = "function"
     function: ToolCallFunction
 
 
 class Message(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     role: Role
     content: str | None = None
     tool_calls: list[ToolCall] | None = None
@@ -34,6 +40,8 @@ class Message(BaseModel):
 
 
 class ChatRequest(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     model: str = "default"
     messages: list[Message]
     tools: list[dict[str, Any]] | None = None
@@ -45,20 +53,26 @@ class ChatRequest(BaseModel):
 class TraceMeta(BaseModel):
     """Trace metadata appended to every response."""
 
+    model_config = ConfigDict(defer_build=True)
+
     request_id: str
-    tools_used: list[str] = []
-    tables_queried: list[str] = []
+    tools_used: list[str] = Field(default_factory=list)
+    tables_queried: list[str] = Field(default_factory=list)
     policy_mode: str = "local_only"
     model: str = ""
 
 
 class Choice(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     index: int = 0
     message: Message
     finish_reason: str | None = None
 
 
 class ChatResponse(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     id: str
     object: str = "chat.completion"
     model: str
@@ -11,7 +11,7 @@ from datetime import datetime, timezone
 from enum import Enum
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class AuditEvent(str, Enum):
@@ -25,13 +25,15 @@ class AuditEvent(str, Enum):
 class AuditEntry(BaseModel):
     """A single audit log record."""
 
+    model_config = ConfigDict(defer_build=True)
+
     ts: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
     request_id: str
     event: AuditEvent
     app: str = ""
     model: str = ""
     policy_mode: str = "local_only"
-    detail: dict[str, Any] = {}  # tool name, table name, file path, etc.
+    detail: dict[str, Any] = Field(default_factory=dict)  # tool name, table name, file path, etc.
 
 
 class AuditLogger(ABC):
@@ -7,12 +7,14 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class EmbeddingResult(BaseModel):
     """Result from an embedding operation."""
 
+    model_config = ConfigDict(defer_build=True)
+
     embeddings: list[list[float]]
     model: str
 
@@ -7,13 +7,15 @@ from __future__ import annotations
 
 from enum import Enum
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, Field
 
 
 # ── Top-level sections ──────────────────────────────────────────────
 
 
 class AppInfo(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     name: str
     version: str = "0.0.1"
 
@@ -24,6 +26,8 @@ class PolicyMode(str, Enum):
 
 
 class RuntimeConfig(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     base_url: str = "http://127.0.0.1:8080"
     policy_mode: PolicyMode = PolicyMode.LOCAL_ONLY
 
@@ -32,58 +36,78 @@ class RuntimeConfig(BaseModel):
 
 
 class NetworkPolicy(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     outbound: str = "deny"  # "deny" | "allow"
-    allow_domains: list[str] = []
+    allow_domains: list[str] = Field(default_factory=list)
 
 
 class DataSqlitePolicy(BaseModel):
-    allow: list[str] = []
+    model_config = ConfigDict(defer_build=True)
+
+    allow: list[str] = Field(default_factory=list)
 
 
 class DataFilesystemPolicy(BaseModel):
-    allow_read: list[str] = []
-    allow_write: list[str] = []
+    model_config = ConfigDict(defer_build=True)
+
+    allow_read: list[str] = Field(default_factory=list)
+    allow_write: list[str] = Field(default_factory=list)
 
 
 class DataVectorPolicy(BaseModel):
-    allow: list[str] = []          # allowed collection/DB paths (read)
-    allow_write: list[str] = []    # paths where insert/update/delete is allowed
+    model_config = ConfigDict(defer_build=True)
+
+    allow: list[str] = Field(default_factory=list)        # allowed collection/DB paths (read)
+    allow_write: list[str] = Field(default_factory=list)  # paths where insert/update/delete is allowed
 
 
 class DataPolicy(BaseModel):
-    sqlite: DataSqlitePolicy = DataSqlitePolicy()
-    filesystem: DataFilesystemPolicy = DataFilesystemPolicy()
-    vector: DataVectorPolicy = DataVectorPolicy()
+    model_config = ConfigDict(defer_build=True)
+
+    sqlite: DataSqlitePolicy = Field(default_factory=DataSqlitePolicy)
+    filesystem: DataFilesystemPolicy = Field(default_factory=DataFilesystemPolicy)
+    vector: DataVectorPolicy = Field(default_factory=DataVectorPolicy)
 
 
 class ToolsPolicy(BaseModel):
-    allow: list[str] = []
+    model_config = ConfigDict(defer_build=True)
+
+    allow: list[str] = Field(default_factory=list)
 
 
 class Policy(BaseModel):
-    network: NetworkPolicy = NetworkPolicy()
-    tools: ToolsPolicy = ToolsPolicy()
-    data: DataPolicy = DataPolicy()
+    model_config = ConfigDict(defer_build=True)
+
+    network: NetworkPolicy = Field(default_factory=NetworkPolicy)
+    tools: ToolsPolicy = Field(default_factory=ToolsPolicy)
+    data: DataPolicy = Field(default_factory=DataPolicy)
 
 
 # ── Models ───────────────────────────────────────────────────────────
 
 
 class ModelEntry(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     id: str
     context_window: int = 8192
 
 
 class ModelsConfig(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     backend: str = "ollama"
     default: str = ""
-    map: dict[str, ModelEntry] = {}
+    map: dict[str, ModelEntry] = Field(default_factory=dict)
 
 
 # ── Per-tool config ──────────────────────────────────────────────────
 
 
 class ToolConfig(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     type: str = "builtin"
     read_only: bool = False
     max_rows: int | None = None
@@ -94,6 +118,8 @@ class ToolConfig(BaseModel):
 
 
 class AuditConfig(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     path: str = "audit.jsonl"
     redact_prompt: bool = False
     redact_tool_outputs: bool = False
@@ -103,11 +129,15 @@ class AuditConfig(BaseModel):
 
 
 class EmbeddingConfig(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     backend: str = "ollama"
     model: str = "nomic-embed-text"
 
 
 class VectorConfig(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     backend: str = "chroma"        # "chroma" or "lance"
     default_top_k: int = 10
 
@@ -116,11 +146,13 @@ class VectorConfig(BaseModel):
 
 
 class Manifest(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     app: AppInfo
-    runtime: RuntimeConfig = RuntimeConfig()
-    policy: Policy = Policy()
-    models: ModelsConfig = ModelsConfig()
-    tools: dict[str, ToolConfig] = {}
-    audit: AuditConfig = AuditConfig()
-    embedding: EmbeddingConfig = EmbeddingConfig()
-    vector_db: VectorConfig = VectorConfig()
+    runtime: RuntimeConfig = Field(default_factory=RuntimeConfig)
+    policy: Policy = Field(default_factory=Policy)
+    models: ModelsConfig = Field(default_factory=ModelsConfig)
+    tools: dict[str, ToolConfig] = Field(default_factory=dict)
+    audit: AuditConfig = Field(default_factory=AuditConfig)
+    embedding: EmbeddingConfig = Field(default_factory=EmbeddingConfig)
+    vector_db: VectorConfig = Field(default_factory=VectorConfig)
@@ -9,7 +9,7 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from enum import Enum
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 from contracts.manifest import Manifest
 from contracts.tool_sdk import ToolInput
@@ -21,6 +21,8 @@ class PolicyVerdict(str, Enum):
 
 
 class PolicyDecision(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     verdict: PolicyVerdict
     rule: str = ""      # which rule triggered the decision
     reason: str = ""    # human-readable explanation
@@ -7,10 +7,11 @@ checks policy, executes the tool, and logs the result.
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from collections.abc import Mapping
 from dataclasses import dataclass, field
 from typing import Any
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, Field
 
 
 # ── Data models ──────────────────────────────────────────────────────
@@ -19,20 +20,26 @@ from pydantic import BaseModel
 class ToolDefinition(BaseModel):
     """OpenAI function-calling compatible schema for a tool."""
 
+    model_config = ConfigDict(defer_build=True)
+
     name: str
     description: str
     input_schema: dict[str, Any]   # JSON Schema
-    output_schema: dict[str, Any] = {}  # JSON Schema (optional Phase 0)
-    permissions: list[str] = []    # e.g. ["data:sqlite", "fs:read"]
+    output_schema: dict[str, Any] = Field(default_factory=dict)  # JSON Schema (optional Phase 0)
+    permissions: list[str] = Field(default_factory=list)          # e.g. ["data:sqlite", "fs:read"]
 
 
 class ToolInput(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     tool_name: str
     arguments: dict[str, Any]
     call_id: str
 
 
 class ToolOutput(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     call_id: str
     tool_name: str
     result: Any = None
@@ -50,7 +57,7 @@ class ToolContext:
     request_id: str
     app_name: str = ""
     policy_mode: str = "local_only"
-    manifest_data_paths: dict[str, Any] = field(default_factory=dict)
+    manifest_data_paths: Mapping[str, Any] = field(default_factory=dict)
 
 
 # ── Abstract base class ─────────────────────────────────────────────
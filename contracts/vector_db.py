@@ -9,7 +9,7 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from typing import Any
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, Field
 
 
 # ── Data models ──────────────────────────────────────────────────────
@@ -18,18 +18,22 @@ from pydantic import BaseModel
 class Document(BaseModel):
     """A document to store in a vector collection."""
 
+    model_config = ConfigDict(defer_build=True)
+
     id: str | None = None
     text: str
-    metadata: dict[str, Any] = {}
+    metadata: dict[str, Any] = Field(default_factory=dict)
     embedding: list[float] | None = None
 
 
 class SearchResult(BaseModel):
     """A single result from a similarity search."""
 
+    model_config = ConfigDict(defer_build=True)
+
     id: str
     text: str
-    metadata: dict[str, Any] = {}
+    metadata: dict[str, Any] = Field(default_factory=dict)
     score: float
 
 
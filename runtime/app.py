@@ -2,24 +2,29 @@
 
 from __future__ import annotations
 
+import importlib
 import os
+import re
 import time
 from contextlib import asynccontextmanager
+from functools import cache
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, AsyncIterator
 
 import httpx
-from fastapi import FastAPI, HTTPException, Query
+from fastapi import FastAPI, HTTPException, Query, Request
+from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import StreamingResponse
 from fastapi.staticfiles import StaticFiles
+from pydantic import ValidationError
 
 from contracts.api import ChatRequest, ChatResponse
 from contracts.audit import AuditEntry, AuditEvent
 
 from runtime.audit.logger import JsonlAuditLogger
-from runtime.audit.query import query_filtered, stream_tail, _read_all
+from runtime.audit.query import count_entries, query_filtered, stream_tail_batches
 from runtime.manifest_loader import load_manifest
 from runtime.metrics import compute_metrics
 from runtime.model_adapters.ollama import OllamaAdapter
@@ -34,6 +39,31 @@ _router: ToolRouter | None = None
 _logger: JsonlAuditLogger | None = None
 _manifest: Any = None
 _start_time: float = 0.0
+_ollama_http: httpx.AsyncClient | None = None
+
+
+# backend -> (module, class name, constructor kwarg for the storage path)
+_VECTOR_BACKENDS: dict[str, tuple[str, str, str]] = {
+    "chroma": ("runtime.vector_adapters.chroma", "ChromaVectorAdapter", "persist_path"),
+    "lance": ("runtime.vector_adapters.lance", "LanceVectorAdapter", "db_path"),
+}
+
+
+@cache
+def _vector_adapter_class(backend: str) -> type | None:
+    """Import a vector backend's adapter class once per process.
+
+    Returns None for unknown backends or when the optional package isn't
+    installed, so the failed import is only probed the first time.
+    """
+    spec = _VECTOR_BACKENDS.get(backend)
+    if spec is None:
+        return None
+    try:
+        module = importlib.import_module(spec[0])
+    except ImportError:
+        return None
+    return getattr(module, spec[1])
 
 
 def _create_embedding_adapter(manifest: Any) -> Any:
@@ -48,25 +78,16 @@ def _create_embedding_adapter(manifest: Any) -> Any:
 def _create_vector_adapter(manifest: Any) -> Any:
     """Create a vector DB adapter from manifest config."""
     backend = manifest.vector_db.backend
-    if backend == "chroma":
-        try:
-            from runtime.vector_adapters.chroma import ChromaVectorAdapter
-            return ChromaVectorAdapter(persist_path=".domekit/vector_db")
-        except ImportError:
-            return None
-    if backend == "lance":
-        try:
-            from runtime.vector_adapters.lance import LanceVectorAdapter
-            return LanceVectorAdapter(db_path=".domekit/vector_db")
-        except ImportError:
-            return None
-    return None
+    cls = _vector_adapter_class(backend)
+    if cls is None:
+        return None
+    return cls(**{_VECTOR_BACKENDS[backend][2]: ".domekit/vector_db"})
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     """Initialise all components on startup."""
-    global _router, _logger, _manifest, _start_time  # noqa: PLW0603
+    global _router, _logger, _manifest, _start_time, _ollama_http  # noqa: PLW0603
 
     _start_time = time.time()
 
@@ -95,14 +116,31 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
         adapter=adapter,
     )
 
+    # Shared by health probes so each poll reuses a keep-alive connection.
+    _ollama_http = httpx.AsyncClient(
+        base_url="http://localhost:11434",
+        timeout=3.0,
+        limits=httpx.Limits(max_keepalive_connections=4),
+    )
+
     yield
 
+    await _ollama_http.aclose()
+    await adapter.aclose()
+    if hasattr(embedding_adapter, "aclose"):
+        await embedding_adapter.aclose()
+    _logger.close()
+
 
 app = FastAPI(title="DomeKit Runtime", version="0.1.0", lifespan=lifespan)
 
+# Precompiled with re.ASCII so \d only matches ASCII digits; re.compile in
+# Starlette returns an already-compiled pattern unchanged.
+_LOCAL_ORIGIN = re.compile(r"^https?://(?:localhost|127\.0\.0\.1)(?::\d+)?$", re.ASCII)
+
 app.add_middleware(
     CORSMiddleware,
-    allow_origin_regex=r"^https?://(localhost|127\.0\.0\.1)(:\d+)?$",
+    allow_origin_regex=_LOCAL_ORIGIN,  # type: ignore[arg-type]
     allow_methods=["*"],
     allow_headers=["*"],
 )
@@ -135,13 +173,13 @@ async def health() -> dict[str, Any]:
         log_path = Path(_manifest.audit.path)
         if log_path.exists():
             result["audit_log_size_bytes"] = log_path.stat().st_size
-            result["audit_log_entries"] = len(_read_all(log_path))
+            result["audit_log_entries"] = count_entries(log_path)
 
     # Ollama status
     ollama_status: dict[str, Any] = {"reachable": False, "models": []}
     try:
-        async with httpx.AsyncClient(timeout=3.0) as client:
-            resp = await client.get("http://localhost:11434/api/tags")
+        if _ollama_http is not None:
+            resp = await _ollama_http.get("/api/tags")
             if resp.status_code == 200:
                 ollama_status["reachable"] = True
                 data = resp.json()
@@ -155,12 +193,37 @@ async def health() -> dict[str, Any]:
     return result
 
 
-@app.post("/v1/chat/completions")
-async def chat_completions(request: ChatRequest) -> ChatResponse:
+# The chat body is validated straight from the raw bytes by pydantic-core
+# instead of FastAPI's json.loads-then-validate path, so its schema is
+# published by hand. The models it references are already components via
+# ChatResponse.
+_CHAT_REQUEST_SCHEMA = ChatRequest.model_json_schema(
+    ref_template="#/components/schemas/{model}"
+)
+_CHAT_REQUEST_SCHEMA.pop("$defs", None)
+
+
+@app.post(
+    "/v1/chat/completions",
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": _CHAT_REQUEST_SCHEMA}},
+        }
+    },
+)
+async def chat_completions(request: Request) -> ChatResponse:
     """OpenAI-compatible chat completions."""
+    try:
+        chat = ChatRequest.model_validate_json(await request.body())
+    except ValidationError as exc:
+        raise RequestValidationError(
+            [{**e, "loc": ("body", *e["loc"])} for e in exc.errors(include_url=False)]
+        ) from None
+
     if _router is None or _manifest is None:
         raise HTTPException(status_code=503, detail="Runtime not initialised")
-    return await _router.run(request, _manifest)
+    return await _router.run(chat, _manifest)
 
 
 @app.get("/v1/domekit/audit/logs")
@@ -195,9 +258,9 @@ async def audit_stream():
         raise HTTPException(status_code=503, detail="Runtime not initialised")
 
     async def event_generator():
-        async for entry in stream_tail(_manifest.audit.path):
-            data = entry.model_dump_json()
-            yield f"data: {data}\n\n"
+        # One write per batch instead of one per entry during bursts.
+        async for batch in stream_tail_batches(_manifest.audit.path):
+            yield "".join(f"data: {e.model_dump_json()}\n\n" for e in batch)
 
     return StreamingResponse(event_generator(), media_type="text/event-stream")
 
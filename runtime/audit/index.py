@@ -0,0 +1,395 @@
+"""Sidecar indexes for the JSONL audit log.
+
+``<log>.idx`` holds one fixed-size record per log line — the event id plus
+the line's byte offset and length — so ``query_by_event`` can jump straight
+to the last N matches instead of scanning the whole log. ``<log>.ridx``
+maps each request id to the spans of its lines, one ``id\toffset\tlength``
+text record per line, so ``query_by_request`` reads only the matching lines.
+Only the spans of recently looked-up ids are kept in memory; others are
+found by searching the .ridx file.
+
+Both are brought up to date lazily on each lookup by scanning only the
+bytes appended since the last one, so the write path stays a single
+``os.write``. Each sidecar's header records which log file it was built
+from, so after a rotation it is rebuilt instead of being read against the
+new file, and spans read back are checked to be whole lines.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import struct
+import threading
+from collections import OrderedDict
+from hashlib import blake2b
+from pathlib import Path
+from typing import BinaryIO
+
+from pydantic_core import to_json
+
+from contracts.audit import AuditEvent
+
+_MAGIC = b"DKAIDX3\0"
+# On-disk event ids are ordinals into AuditEvent, so its member list is part
+# of the format: adding or reordering a member invalidates older indexes.
+_EVENTS_DIGEST = blake2b("\n".join(e.value for e in AuditEvent).encode(), digest_size=8).digest()
+# Which log an index belongs to: st_dev, st_ino, then the length and hash
+# of the log's first bytes, in case an inode number is reused
+_IDENTITY = struct.Struct("<QQI16s")
+_IDENTITY_HEAD = 256
+# magic, events digest, log identity, number of log bytes already indexed, number of records
+_HEADER = struct.Struct(f"<8s8s{_IDENTITY.size}sQQ")
+# event id, line offset, line length
+_RECORD = struct.Struct("<BQI")
+
+_EVENT_IDS: dict[bytes, int] = {e.value.encode(): i for i, e in enumerate(AuditEvent)}
+_EVENT_KEY = b'"event":"'
+
+_REQUEST_KEY = b'"request_id":"'
+# Bucket for ids whose JSON form has escapes; always read and filtered by the caller
+_ESCAPED_ID = b""
+# .ridx header: "#" + hex log identity + newline
+_RIDX_HEADER_SIZE = 2 + 2 * _IDENTITY.size
+# (st_dev, st_ino) of a log -> (log bytes indexed, .ridx bytes consumed),
+# least recently used first
+_REQUEST_STATE: OrderedDict[tuple[int, int], tuple[int, int]] = OrderedDict()
+_REQUEST_LOGS = 8
+# ((st_dev, st_ino), request id) -> [(offset, length)], least recently used first
+_REQUEST_SPANS: OrderedDict[tuple[tuple[int, int], bytes], list[tuple[int, int]]] = OrderedDict()
+_REQUEST_SPANS_MAX = 256
+_REQUEST_LOCK = threading.Lock()
+# Serializes .idx refreshes within the process
+_EVENT_LOCK = threading.Lock()
+
+
+def event_lines(log_path: str | Path, event: AuditEvent, limit: int = 100) -> list[bytes]:
+    """Return the raw JSONL lines of the last *limit* entries of *event*."""
+    p = Path(log_path)
+    try:
+        f = p.open("rb")
+    except FileNotFoundError:
+        return []
+    with f:
+        records = _refresh(p, f)
+        if not records:
+            return []
+
+        # The event ids form a strided column; bytes.rfind walks it backwards
+        # at C speed, touching only the matches we keep.
+        column = records[:: _RECORD.size]
+        eid = bytes([_EVENT_IDS[AuditEvent(event).value.encode()]])
+        hits: list[int] = []
+        pos = len(column)
+        while limit <= 0 or len(hits) < limit:
+            pos = column.rfind(eid, 0, pos)
+            if pos == -1:
+                break
+            hits.append(pos)
+        hits.reverse()
+        if limit < 0:
+            hits = hits[-limit:]
+
+        lines: list[bytes] = []
+        fd = f.fileno()
+        for i in hits:
+            _, offset, length = _RECORD.unpack_from(records, i * _RECORD.size)
+            line = _read_line(fd, offset, length)
+            if line is not None:
+                lines.append(line)
+        return lines
+
+
+def request_lines(log_path: str | Path, request_id: str) -> list[bytes]:
+    """Return the raw JSONL lines that may belong to *request_id*.
+
+    Callers must still check the decoded ``request_id``: ids that needed
+    JSON escaping share one bucket.
+    """
+    p = Path(log_path)
+    try:
+        f = p.open("rb")
+    except FileNotFoundError:
+        return []
+    key = to_json(request_id)[1:-1]
+    with f:
+        st = os.fstat(f.fileno())
+        log_id = (st.st_dev, st.st_ino)
+        with _REQUEST_LOCK:
+            unindexed = _refresh_requests(p, f, st)
+            spans: list[tuple[int, int]] = []
+            for k in {key, _ESCAPED_ID}:
+                spans += _cached_spans(p, log_id, k)
+                spans += [(offset, length) for rk, offset, length in unindexed if rk == k]
+        if not spans:
+            return []
+
+        spans.sort()
+        fd = f.fileno()
+        lines = (_read_line(fd, offset, length) for offset, length in spans)
+        return [line for line in lines if line is not None]
+
+
+def _cached_spans(log_path: Path, log_id: tuple[int, int], key: bytes) -> list[tuple[int, int]]:
+    """Return the indexed spans of *key*, searching the .ridx file on a miss."""
+    spans = _REQUEST_SPANS.pop((log_id, key), None)
+    if spans is None:
+        spans = _search_ridx(log_path, log_id, key)
+    _REQUEST_SPANS[(log_id, key)] = spans
+    while len(_REQUEST_SPANS) > _REQUEST_SPANS_MAX:
+        _REQUEST_SPANS.popitem(last=False)
+    return list(spans)
+
+
+def _search_ridx(log_path: Path, log_id: tuple[int, int], key: bytes) -> list[tuple[int, int]]:
+    _, consumed = _REQUEST_STATE.get(log_id, (0, 0))
+    try:
+        with log_path.with_name(log_path.name + ".ridx").open("rb") as f:
+            data = f.read(consumed)[_RIDX_HEADER_SIZE:]
+    except OSError:
+        return []
+    pattern = re.compile(rb"^" + re.escape(key) + rb"\t(\d+)\t(\d+)$", re.MULTILINE)
+    spans: list[tuple[int, int]] = []
+    indexed = 0
+    for m in pattern.finditer(data):
+        offset, length = int(m[1]), int(m[2])
+        if offset >= indexed:  # skip duplicates from a concurrent refresh
+            spans.append((offset, length))
+            indexed = offset + length + 1
+    return spans
+
+
+def _note_span(log_id: tuple[int, int], key: bytes, offset: int, length: int) -> None:
+    spans = _REQUEST_SPANS.get((log_id, key))
+    if spans is not None:
+        spans.append((offset, length))
+
+
+def _forget(log_id: tuple[int, int]) -> None:
+    for k in [k for k in _REQUEST_SPANS if k[0] == log_id]:
+        del _REQUEST_SPANS[k]
+
+
+def _ridx_header(f: BinaryIO, st: os.stat_result) -> bytes:
+    return b"#" + _identity(f, st, min(st.st_size, _IDENTITY_HEAD)).hex().encode() + b"\n"
+
+
+def _ridx_matches(f: BinaryIO, st: os.stat_result, header: bytes) -> bool:
+    """Return True if the .ridx *header* was written for the log open as *f*."""
+    if len(header) != _RIDX_HEADER_SIZE or header[:1] != b"#" or header[-1:] != b"\n":
+        return False
+    try:
+        identity = bytes.fromhex(header[1:-1].decode("ascii"))
+    except ValueError:
+        return False
+    return _same_log(f, st, identity)
+
+
+def _reset_ridx(ridx_path: Path, f: BinaryIO, st: os.stat_result) -> int:
+    """Start an empty .ridx for the log open as *f*; return its size (0 if unwritable)."""
+    _forget((st.st_dev, st.st_ino))
+    header = _ridx_header(f, st)
+    try:
+        ridx_path.write_bytes(header)
+    except OSError:
+        return 0
+    return len(header)
+
+
+def _refresh_requests(log_path: Path, f: BinaryIO, st: os.stat_result) -> list[tuple[bytes, int, int]]:
+    """Bring the request index up to date with the log open as *f*.
+
+    Returns the records that could not be written to the .ridx file (a
+    read-only log directory); those are re-scanned on every lookup.
+    """
+    ridx_path = log_path.with_name(log_path.name + ".ridx")
+    log_id = (st.st_dev, st.st_ino)
+    size = st.st_size
+    indexed, consumed = _REQUEST_STATE.pop(log_id, (0, 0))
+
+    # Pick up records written by other processes since our last look, unless
+    # the .ridx was built for another file (say, before a rotation).
+    data = b""
+    try:
+        with ridx_path.open("rb") as r:
+            if _ridx_matches(f, st, r.read(_RIDX_HEADER_SIZE)) and os.fstat(r.fileno()).st_size >= consumed:
+                r.seek(max(consumed, _RIDX_HEADER_SIZE))
+                consumed = max(consumed, _RIDX_HEADER_SIZE)
+                data = r.read()
+            else:
+                indexed, consumed = 0, -1
+    except FileNotFoundError:
+        indexed, consumed = 0, -1
+    except OSError:
+        pass
+    if consumed == -1:
+        consumed = _reset_ridx(ridx_path, f, st)
+
+    end = data.rfind(b"\n") + 1
+    for record in data[:end].splitlines():
+        key, offset, length = record.split(b"\t")
+        offset, length = int(offset), int(length)
+        if offset >= indexed:  # skip duplicates from a concurrent refresh
+            _note_span(log_id, key, offset, length)
+            indexed = offset + length + 1
+    consumed += end
+
+    if indexed != size:
+        # A log that was truncated and regrown no longer lines up.
+        if indexed > size or (indexed and os.pread(f.fileno(), 1, indexed - 1) != b"\n"):
+            indexed = 0
+            consumed = _reset_ridx(ridx_path, f, st)
+        f.seek(indexed)
+        chunk = f.read(size - indexed)
+    else:
+        chunk = b""
+    # Leave a partially written trailing line for the next refresh.
+    end = chunk.rfind(b"\n") + 1
+
+    new: list[tuple[bytes, int, int]] = []
+    start = 0
+    while start < end:
+        stop = chunk.index(b"\n", start)
+        k = chunk.find(_REQUEST_KEY, start, stop)
+        if k != -1:
+            k += len(_REQUEST_KEY)
+            q = chunk.find(b'"', k, stop)
+            key = chunk[k:q]
+            if q == -1 or b"\\" in key:
+                key = _ESCAPED_ID
+            new.append((key, indexed + start, stop - start))
+        start = stop + 1
+
+    if new:
+        try:
+            if not consumed:
+                raise OSError("no .ridx header")
+            with ridx_path.open("ab") as r:
+                r.write(b"".join(b"%s\t%d\t%d\n" % record for record in new))
+                consumed = r.tell()
+        except OSError:
+            # Read-only log directory: leave these lines unindexed.
+            _remember(log_id, indexed, consumed)
+            return new
+        for record in new:
+            _note_span(log_id, *record)
+    _remember(log_id, indexed + end, consumed)
+    return []
+
+
+def _remember(log_id: tuple[int, int], indexed: int, consumed: int) -> None:
+    _REQUEST_STATE[log_id] = (indexed, consumed)
+    while len(_REQUEST_STATE) > _REQUEST_LOGS:
+        _forget(_REQUEST_STATE.popitem(last=False)[0])
+
+
+def _read_line(fd: int, offset: int, length: int) -> bytes | None:
+    """Return the log line at *offset*, or None if the span isn't a whole line."""
+    start = max(offset - 1, 0)
+    data = os.pread(fd, length + 1 + offset - start, start)
+    if offset and data[:1] != b"\n":
+        return None
+    line = data[offset - start : offset - start + length]
+    if len(line) != length or data[offset - start + length :] != b"\n":
+        return None
+    return line
+
+
+def _identity(f: BinaryIO, st: os.stat_result, n: int) -> bytes:
+    """Identify the log open as *f* by device, inode and its first *n* bytes."""
+    head = os.pread(f.fileno(), n, 0)
+    return _IDENTITY.pack(st.st_dev, st.st_ino, n, blake2b(head, digest_size=16).digest())
+
+
+def _same_log(f: BinaryIO, st: os.stat_result, identity: bytes) -> bool:
+    """Return True if *identity* was taken from the log open as *f*."""
+    dev, ino, n, _ = _IDENTITY.unpack(identity)
+    return (dev, ino) == (st.st_dev, st.st_ino) and n <= st.st_size and _identity(f, st, n) == identity
+
+
+def _refresh(log_path: Path, f: BinaryIO) -> bytes:
+    """Bring the index up to date with the log open as *f* and return its records.
+
+    New records are written after the existing ones and the header is
+    updated in place afterwards, so a refresh costs only what was
+    appended. The header's record count decides how many records are
+    valid, so an interrupted refresh leaves at most an ignored tail.
+    """
+    idx_path = log_path.with_name(log_path.name + ".idx")
+    with _EVENT_LOCK:
+        st = os.fstat(f.fileno())
+        try:
+            fd = os.open(idx_path, os.O_RDWR | os.O_CREAT, 0o644)
+        except OSError:
+            fd = -1  # read-only log directory: index in memory, re-scan next time
+        try:
+            return _refresh_fd(f, st, fd)
+        finally:
+            if fd >= 0:
+                os.close(fd)
+
+
+def _refresh_fd(f: BinaryIO, st: os.stat_result, fd: int) -> bytes:
+    size = st.st_size
+    indexed, records = 0, b""
+    if fd >= 0:
+        data = os.pread(fd, os.fstat(fd).st_size, 0)
+        try:
+            magic, events, identity, upto, count = _HEADER.unpack_from(data)
+        except struct.error:
+            pass
+        else:
+            stop = _HEADER.size + count * _RECORD.size
+            if (
+                magic == _MAGIC
+                and events == _EVENTS_DIGEST
+                and upto <= size
+                and stop <= len(data)
+                and _same_log(f, st, identity)
+            ):
+                indexed, records = upto, data[_HEADER.size : stop]
+
+    if indexed == size:
+        return records
+
+    # A log that was truncated and regrown no longer lines up.
+    if indexed and os.pread(f.fileno(), 1, indexed - 1) != b"\n":
+        indexed, records = 0, b""
+    f.seek(indexed)
+    chunk = f.read(size - indexed)
+    # Leave a partially written trailing line for the next refresh.
+    end = chunk.rfind(b"\n") + 1
+    if end == 0:
+        return records
+
+    new = bytearray()
+    start = 0
+    while start < end:
+        stop = chunk.index(b"\n", start)
+        k = chunk.find(_EVENT_KEY, start, stop)
+        if k != -1:
+            k += len(_EVENT_KEY)
+            eid = _EVENT_IDS.get(chunk[k : chunk.find(b'"', k, stop)])
+            if eid is not None:
+                new += _RECORD.pack(eid, indexed + start, stop - start)
+        start = stop + 1
+
+    old_len = len(records)
+    records += new
+    indexed += end
+    # Best effort: a read-only index file just re-scans next time.
+    if fd >= 0:
+        header = _HEADER.pack(
+            _MAGIC,
+            _EVENTS_DIGEST,
+            _identity(f, st, min(indexed, _IDENTITY_HEAD)),
+            indexed,
+            len(records) // _RECORD.size,
+        )
+        try:
+            os.pwrite(fd, new, _HEADER.size + old_len)
+            os.pwrite(fd, header, 0)
+            os.ftruncate(fd, _HEADER.size + len(records))
+        except OSError:
+            pass
+    return records
@@ -2,49 +2,130 @@
 
 from __future__ import annotations
 
-import json
+import os
 import threading
 from pathlib import Path
 
+from pydantic import TypeAdapter
+from pydantic_core import from_json
+
 from contracts.audit import AuditEntry, AuditEvent, AuditLogger
+from runtime.audit.index import event_lines, request_lines
+
+# Validating a whole batch in one call keeps the loop inside pydantic-core
+# instead of paying the per-model call overhead for every line.
+_ENTRIES = TypeAdapter(list[AuditEntry])
+# Serializes straight to bytes, skipping the str round-trip of model_dump_json.
+_ENTRY = TypeAdapter(AuditEntry)
+
+# Block size for reading the log backwards in tail().
+_TAIL_BLOCK = 64 * 1024
 
 
 class JsonlAuditLogger(AuditLogger):
-    """Thread-safe, append-only JSONL audit logger."""
+    """Thread-safe, append-only JSONL audit logger.
+
+    The file is held open with ``O_APPEND``; each entry goes out as a single
+    ``os.write``, which the kernel appends atomically, so concurrent callers
+    need no lock.
+
+    Before each write the path is checked against the open file, so when
+    the log is rotated by renaming (or removed), the logger reopens the
+    path instead of writing on into the old file.
+    """
 
     def __init__(self, path: str | Path) -> None:
         self._path = Path(path)
-        self._lock = threading.Lock()
         # Ensure parent directory exists
         self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._fd = os.open(self._path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        st = os.fstat(self._fd)
+        self._file_id = (st.st_dev, st.st_ino)
+        self._reopen_lock = threading.Lock()
 
     def log(self, entry: AuditEntry) -> None:
-        line = entry.model_dump_json() + "\n"
-        with self._lock:
-            with self._path.open("a", encoding="utf-8") as f:
-                f.write(line)
+        data = _ENTRY.dump_json(entry) + b"\n"
+        try:
+            st = os.stat(self._path)
+            rotated = (st.st_dev, st.st_ino) != self._file_id
+        except FileNotFoundError:
+            rotated = True
+        if rotated:
+            self._reopen()
+        os.write(self._fd, data)
+
+    def _reopen(self) -> None:
+        with self._reopen_lock:
+            if self._fd < 0:
+                return  # closed
+            fd = os.open(self._path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            try:
+                # dup2 swaps the file behind the same descriptor number, so a
+                # concurrent write lands in the old or the new file, never on
+                # a closed descriptor.
+                os.dup2(fd, self._fd)
+                st = os.fstat(fd)
+                self._file_id = (st.st_dev, st.st_ino)
+            finally:
+                os.close(fd)
+
+    def close(self) -> None:
+        """Close the underlying file descriptor."""
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
 
     def query_by_request(self, request_id: str) -> list[AuditEntry]:
-        return [e for e in self._read_all() if e.request_id == request_id]
+        # The request index yields only candidate lines; only real matches
+        # are validated.
+        lines = request_lines(self._path, request_id)
+        return _ENTRIES.validate_python(
+            [d for d in map(from_json, lines) if d.get("request_id") == request_id]
+        )
 
     def query_by_event(self, event: AuditEvent, limit: int = 100) -> list[AuditEntry]:
-        matches = [e for e in self._read_all() if e.event == event]
-        return matches[-limit:]
+        return [e for e in _validate_lines(event_lines(self._path, event, limit)) if e.event == event]
 
     def tail(self, n: int = 20) -> list[AuditEntry]:
-        entries = self._read_all()
-        return entries[-n:]
+        if n <= 0:
+            return self._read_all()[-n:]
+        return _validate_lines(_tail_lines(self._path, n))
 
     # ── internal ────────────────────────────────────────────────────
 
     def _read_all(self) -> list[AuditEntry]:
-        if not self._path.exists():
-            return []
-        entries: list[AuditEntry] = []
-        with self._path.open("r", encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
-                if not line:
-                    continue
-                entries.append(AuditEntry(**json.loads(line)))
-        return entries
+        return _validate_lines(_read_lines(self._path))
+
+
+def _read_lines(path: Path) -> list[bytes]:
+    """Return every non-empty line of *path* as raw bytes."""
+    if not path.exists():
+        return []
+    return [line for line in path.read_bytes().split(b"\n") if line.strip()]
+
+
+def _validate_lines(lines: list[bytes]) -> list[AuditEntry]:
+    """Parse and validate raw JSONL lines in a single pydantic-core call."""
+    if not lines:
+        return []
+    return _ENTRIES.validate_json(b"[" + b",".join(lines) + b"]")
+
+
+def _tail_lines(path: Path, n: int) -> list[bytes]:
+    """Return the last *n* non-empty lines of *path*, reading it backwards."""
+    if not path.exists():
+        return []
+    with path.open("rb") as f:
+        pos = f.seek(0, os.SEEK_END)
+        buf = b""
+        while True:
+            lines = buf.split(b"\n")
+            if pos > 0:
+                lines = lines[1:]  # first piece may be a partial line
+            lines = [line for line in lines if line.strip()]
+            if len(lines) >= n or pos == 0:
+                return lines[-n:]
+            size = min(_TAIL_BLOCK, pos)
+            pos -= size
+            f.seek(pos)
+            buf = f.read(size) + buf
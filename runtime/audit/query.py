@@ -7,32 +7,86 @@ of needing a logger instance for read-only queries.
 
 from __future__ import annotations
 
-import asyncio
-import json
+import heapq
+import os
+import threading
+from collections import OrderedDict
 from datetime import datetime
+from itertools import pairwise
+from operator import attrgetter
 from pathlib import Path
-from typing import AsyncIterator
+from typing import AsyncIterator, BinaryIO
+
+from pydantic_core import from_json
 
 from contracts.audit import AuditEntry, AuditEvent
+from runtime.audit.index import event_lines, request_lines
+from runtime.audit.logger import (
+    _ENTRIES,
+    _tail_lines,
+    _validate_lines,
+)
+from runtime.audit.watch import FileWatch
 
 
 def query_by_request(log_path: str | Path, request_id: str) -> list[AuditEntry]:
     """Return all audit entries for a given request_id."""
-    return [e for e in _read_all(log_path) if e.request_id == request_id]
+    lines = request_lines(log_path, request_id)
+    return _ENTRIES.validate_python(
+        [d for d in map(from_json, lines) if d.get("request_id") == request_id]
+    )
 
 
 def query_by_event(
     log_path: str | Path, event: AuditEvent, limit: int = 100
 ) -> list[AuditEntry]:
     """Return recent entries of a given event type."""
-    matches = [e for e in _read_all(log_path) if e.event == event]
-    return matches[-limit:]
+    # The index is validated against the log, but only the decoded event is authoritative.
+    return [e for e in _validate_lines(event_lines(log_path, event, limit)) if e.event == event]
 
 
 def tail(log_path: str | Path, n: int = 20) -> list[AuditEntry]:
     """Return the last N entries from the audit log."""
-    entries = _read_all(log_path)
-    return entries[-n:]
+    if n <= 0:
+        return _read_all(log_path)[-n:]
+    return _validate_lines(_tail_lines(Path(log_path), n))
+
+
+# (st_dev, st_ino) -> (bytes counted, fingerprint, newline count) for
+# count_entries(), least recently used first; validated like _ENTRY_CACHE.
+_COUNT_CACHE: OrderedDict[tuple[int, int], tuple[int, bytes, int]] = OrderedDict()
+_COUNT_CACHE_LOGS = 8
+_COUNT_LOCK = threading.Lock()
+
+
+def count_entries(log_path: str | Path) -> int:
+    """Return the number of entries in the audit log without parsing it.
+
+    Counts newlines (the logger writes exactly one per entry), resuming from
+    where the previous call stopped while the file is only appended to. A
+    file that shrank or whose fingerprint changed is recounted.
+    """
+    p = Path(log_path)
+    try:
+        f = p.open("rb")
+    except FileNotFoundError:
+        return 0
+
+    with f:
+        st = os.fstat(f.fileno())
+        key = (st.st_dev, st.st_ino)
+        with _COUNT_LOCK:
+            done, fingerprint, count = _COUNT_CACHE.pop(key, (0, b"", 0))
+            if done and (st.st_size < done or _fingerprint(f, done) != fingerprint):
+                done, count = 0, 0  # truncated or rewritten: recount
+            f.seek(done)
+            while chunk := f.read(1 << 20):
+                count += chunk.count(b"\n")
+                done += len(chunk)
+            _COUNT_CACHE[key] = (done, _fingerprint(f, done), count)
+            while len(_COUNT_CACHE) > _COUNT_CACHE_LOGS:
+                _COUNT_CACHE.popitem(last=False)
+            return count
 
 
 def query_filtered(
@@ -49,22 +103,31 @@ def query_filtered(
 
     Returns (entries, total_matching_count).
     """
-    all_entries = _read_all(log_path)
-    filtered = all_entries
-
-    if event is not None:
-        filtered = [e for e in filtered if e.event == event]
+    # A request id narrows the log to a handful of lines via the request index.
     if request_id is not None:
-        filtered = [e for e in filtered if e.request_id == request_id]
-    if since is not None:
-        filtered = [e for e in filtered if e.ts >= since]
-    if until is not None:
-        filtered = [e for e in filtered if e.ts <= until]
+        candidates = query_by_request(log_path, request_id)
+    else:
+        candidates = _read_all(log_path)
+
+    # One pass with every predicate. The timestamps are compared as datetimes:
+    # converting each one with .timestamp() costs more than the comparison.
+    filtered = [
+        e
+        for e in candidates
+        if (event is None or e.event == event)
+        and (since is None or e.ts >= since)
+        and (until is None or e.ts <= until)
+    ]
 
     total = len(filtered)
-    # Most recent first
-    filtered.sort(key=lambda e: e.ts, reverse=True)
-    page = filtered[offset : offset + limit]
+    # Most recent first. The log is normally written in time order, so the
+    # page is just a reversed slice; otherwise only the top offset + limit
+    # entries are ranked instead of sorting them all.
+    if all(a.ts < b.ts for a, b in pairwise(filtered)):
+        stop = max(total - offset, 0)
+        page = filtered[max(stop - limit, 0) : stop][::-1]
+    else:
+        page = heapq.nlargest(offset + limit, filtered, key=attrgetter("ts"))[offset:]
     return page, total
 
 
@@ -75,31 +138,92 @@ async def stream_tail(
 
     Polls the JSONL file for new lines every *poll_interval* seconds.
     """
+    async for batch in stream_tail_batches(log_path, poll_interval):
+        for entry in batch:
+            yield entry
+
+
+async def stream_tail_batches(
+    log_path: str | Path, poll_interval: float = 0.5, max_batch: int = 16
+) -> AsyncIterator[list[AuditEntry]]:
+    """Yield new audit entries in batches as they are appended to the log file.
+
+    Everything appended between two polls comes out together, split into
+    batches of at most *max_batch* entries, so a burst costs one yield per
+    batch rather than one per entry. A trailing line that is still being
+    written is held back until its newline lands.
+
+    Where inotify is available the stream wakes as soon as the log is
+    written; *poll_interval* is then only an upper bound between checks.
+    """
     p = Path(log_path)
     # Start at end of file
     pos = p.stat().st_size if p.exists() else 0
 
-    while True:
-        if p.exists() and p.stat().st_size > pos:
-            with p.open("r", encoding="utf-8") as f:
-                f.seek(pos)
-                for line in f:
-                    line = line.strip()
-                    if line:
-                        yield AuditEntry(**json.loads(line))
-                pos = f.tell()
-        await asyncio.sleep(poll_interval)
+    watch = FileWatch(p)
+    try:
+        while True:
+            if p.exists() and p.stat().st_size > pos:
+                with p.open("rb") as f:
+                    f.seek(pos)
+                    chunk = f.read()
+                end = chunk.rfind(b"\n") + 1
+                pos += end
+                lines = [line for line in chunk[:end].split(b"\n") if line.strip()]
+                for i in range(0, len(lines), max_batch):
+                    yield _validate_lines(lines[i : i + max_batch])
+            await watch.wait(poll_interval)
+    finally:
+        watch.close()
+
+
+# (st_dev, st_ino) -> (bytes parsed, fingerprint, entries) for _read_all(),
+# least recently used first. Only the most recently read logs are kept, so
+# memory stays bounded by the logs actually being served.
+_ENTRY_CACHE: OrderedDict[tuple[int, int], tuple[int, bytes, list[AuditEntry]]] = OrderedDict()
+_ENTRY_CACHE_LOGS = 2
+# Held across read-extend-store so concurrent readers never interleave.
+_ENTRY_LOCK = threading.Lock()
+_FINGERPRINT_BYTES = 64
 
 
 def _read_all(log_path: str | Path) -> list[AuditEntry]:
+    """Return every entry in the log, parsing only what was appended since the last call.
+
+    The log is append-only, so parsed entries are kept per file and only
+    the new tail is parsed on later calls. The first and last bytes of the
+    parsed region are kept as a fingerprint; if the file shrank or they no
+    longer match (truncated, rotated, or replaced), it is re-read in full.
+    """
     p = Path(log_path)
-    if not p.exists():
+    try:
+        st = p.stat()
+    except FileNotFoundError:
         return []
-    entries: list[AuditEntry] = []
-    with p.open("r", encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-            entries.append(AuditEntry(**json.loads(line)))
-    return entries
+
+    key = (st.st_dev, st.st_ino)
+    with _ENTRY_LOCK, p.open("rb") as f:
+        done, fingerprint, entries = _ENTRY_CACHE.pop(key, (0, b"", []))
+        if done and (st.st_size < done or _fingerprint(f, done) != fingerprint):
+            done, entries = 0, []
+        f.seek(done)
+        chunk = f.read()
+        # Leave a partially written trailing line for the next call.
+        end = chunk.rfind(b"\n") + 1
+        if end:
+            lines = [line for line in chunk[:end].split(b"\n") if line.strip()]
+            entries.extend(_validate_lines(lines))
+            done += end
+            fingerprint = _fingerprint(f, done)
+        _ENTRY_CACHE[key] = (done, fingerprint, entries)
+        while len(_ENTRY_CACHE) > _ENTRY_CACHE_LOGS:
+            _ENTRY_CACHE.popitem(last=False)
+        return list(entries)
+
+
+def _fingerprint(f: BinaryIO, size: int) -> bytes:
+    n = min(_FINGERPRINT_BYTES, size)
+    f.seek(0)
+    head = f.read(n)
+    f.seek(size - n)
+    return head + f.read(n)
@@ -0,0 +1,94 @@
+"""Wake-on-write notification for tailing the audit log.
+
+On Linux, ``FileWatch`` registers an inotify watch on the log's directory
+(through libc via ctypes) so a tailing coroutine wakes as soon as the log
+is written instead of at its next poll. Elsewhere, or if inotify is not
+available, ``wait()`` simply sleeps for the timeout and callers keep
+polling as before.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import ctypes
+import ctypes.util
+import os
+import struct
+import sys
+from pathlib import Path
+
+_IN_MODIFY = 0x00000002
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+# wd, mask, cookie, name length — followed by the NUL-padded name
+_EVENT = struct.Struct("iIII")
+
+
+def _load_libc() -> ctypes.CDLL | None:
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        libc.inotify_init1, libc.inotify_add_watch
+    except (OSError, AttributeError):
+        return None
+    return libc
+
+
+_LIBC = _load_libc()
+
+
+class FileWatch:
+    """Signals when *path* is written, created, or replaced."""
+
+    def __init__(self, path: str | Path) -> None:
+        self._name = os.fsencode(Path(path).name)
+        self._changed = asyncio.Event()
+        self._loop = asyncio.get_running_loop()
+        self._fd = -1
+        if _LIBC is None:
+            return
+
+        fd = _LIBC.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if fd < 0:
+            return
+        # Watch the directory rather than the file so a log that does not
+        # exist yet, or is rotated into place, is still picked up.
+        mask = _IN_MODIFY | _IN_CREATE | _IN_MOVED_TO
+        if _LIBC.inotify_add_watch(fd, os.fsencode(Path(path).parent), mask) < 0:
+            os.close(fd)
+            return
+        self._fd = fd
+        self._loop.add_reader(fd, self._on_events)
+
+    @property
+    def active(self) -> bool:
+        """True when inotify is delivering events for the file."""
+        return self._fd >= 0
+
+    async def wait(self, timeout: float) -> None:
+        """Return once the file has changed, or after *timeout* seconds."""
+        try:
+            await asyncio.wait_for(self._changed.wait(), timeout)
+        except TimeoutError:
+            pass
+        self._changed.clear()
+
+    def close(self) -> None:
+        if self._fd >= 0:
+            self._loop.remove_reader(self._fd)
+            os.close(self._fd)
+            self._fd = -1
+
+    def _on_events(self) -> None:
+        try:
+            buf = os.read(self._fd, 4096)
+        except BlockingIOError:
+            return
+        offset = 0
+        while offset < len(buf):
+            _, _, _, length = _EVENT.unpack_from(buf, offset)
+            start = offset + _EVENT.size
+            if buf[start : start + length].rstrip(b"\0") == self._name:
+                self._changed.set()
+            offset = start + length
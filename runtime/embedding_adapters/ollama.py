@@ -20,16 +20,31 @@ class OllamaEmbeddingAdapter(EmbeddingAdapter):
     ) -> None:
         self._base_url = base_url.rstrip("/")
         self._model = model
+        self._client: httpx.AsyncClient | None = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the shared client, creating it on first use."""
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                timeout=30.0,
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP client, if one was opened."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
 
     async def embed(self, texts: list[str]) -> list[list[float]]:
         """Generate embeddings for a list of texts via Ollama."""
         payload = {"model": self._model, "input": texts}
 
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                resp = await client.post(
-                    f"{self._base_url}/api/embed", json=payload
-                )
+            resp = await self._get_client().post(
+                f"{self._base_url}/api/embed", json=payload
+            )
         except httpx.ConnectError as exc:
             raise RuntimeError(
                 f"Cannot connect to Ollama at {self._base_url}: {exc}"
@@ -0,0 +1,45 @@
+"""Glob allow-list matching shared by the policy engine and the tools.
+
+An allow list's fnmatch patterns are merged into one compiled regex, so a
+check is a single match however long the list is. Paths and patterns are
+both ``os.path.normcase``-d and every pattern must match the whole name,
+exactly as ``fnmatch.fnmatch`` would.
+"""
+
+from __future__ import annotations
+
+import fnmatch
+import os
+import re
+from collections.abc import Iterable
+
+# One allow list's glob patterns merged into a single regex, plus the
+# original patterns indexed by group number for decision reasons
+Globs = tuple[re.Pattern[str] | None, tuple[str, ...]]
+
+
+def compile_globs(patterns: Iterable[str]) -> Globs:
+    """Translate fnmatch patterns into one alternation, compiled once.
+
+    Each pattern becomes a named group ``p<i>`` so a match still tells us
+    which pattern allowed the path.
+    """
+    patterns = tuple(patterns)
+    if not patterns:
+        return None, ()
+    groups = []
+    for i, pattern in enumerate(patterns):
+        body = fnmatch.translate(os.path.normcase(pattern)).removesuffix(r"\Z")
+        groups.append(f"(?P<p{i}>{body})")
+    return re.compile("(?:" + "|".join(groups) + r")\Z"), patterns
+
+
+def first_match(globs: Globs, path: str) -> str | None:
+    """Return the first pattern in *globs* matching *path*, as ``fnmatch`` would."""
+    rx, patterns = globs
+    if rx is None:
+        return None
+    # Alternatives are tried in order, so the matched group is the first
+    # pattern that matches the whole path.
+    m = rx.match(os.path.normcase(path))
+    return patterns[int(m.lastgroup[1:])] if m else None
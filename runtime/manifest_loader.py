@@ -2,23 +2,87 @@
 
 from __future__ import annotations
 
+import os
+import threading
+from hashlib import blake2b
 from pathlib import Path
 
-import yaml
+import pydantic
 from pydantic import ValidationError
 
 from contracts.manifest import Manifest
 
+# Parsed manifests are memoized in-process keyed on a hash of the file's
+# contents, and each caller gets its own copy. Setting
+# DOMEKIT_MANIFEST_CACHE=1 also caches the validated JSON next to the YAML
+# (under .domekit/), so separate `domekit validate`/`run` processes skip
+# the YAML parse too.
+_CACHE_ENV = "DOMEKIT_MANIFEST_CACHE"
+_CACHE_FILE = Path(".domekit") / "manifest.cache"
+
+# resolved path -> (content key, manifest); never handed out directly
+_MEMO: dict[str, tuple[bytes, Manifest]] = {}
+
 
 def load_manifest(path: str) -> Manifest:
     """Load a domekit.yaml file and return a validated Manifest."""
     p = Path(path)
-    if not p.exists():
-        raise FileNotFoundError(f"Manifest not found: {path}")
+    try:
+        raw = p.read_bytes()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Manifest not found: {path}") from None
+
+    # The manifest carries the security policy: key on what the file
+    # actually says, not on its mtime or size.
+    key = f"{blake2b(raw, digest_size=16).hexdigest()}|{pydantic.VERSION}".encode()
+    resolved = str(p.resolve())
+    memo = _MEMO.get(resolved)
+    if memo is None or memo[0] != key:
+        manifest = None
+        cache = p.parent / _CACHE_FILE
+        use_file_cache = os.environ.get(_CACHE_ENV) == "1"
+        if use_file_cache:
+            manifest = _read_cache(cache, key)
+        if manifest is None:
+            manifest = _parse(raw)
+            if use_file_cache:
+                _write_cache(cache, key, manifest)
+        memo = _MEMO[resolved] = (key, manifest)
+    # Callers may modify what they get back; keep the memoized one pristine.
+    return memo[1].model_copy(deep=True)
+
+
+def _parse(raw: bytes) -> Manifest:
+    # Imported here so a cache hit never loads PyYAML.
+    import yaml
 
-    raw = p.read_text(encoding="utf-8")
-    data = yaml.safe_load(raw)
+    # libyaml's C loader when PyYAML was built with it
+    data = yaml.load(raw.decode("utf-8"), Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
     if not isinstance(data, dict):
         raise ValueError(f"Manifest must be a YAML mapping, got {type(data).__name__}")
 
     return Manifest(**data)
+
+
+def _read_cache(cache: Path, key: bytes) -> Manifest | None:
+    try:
+        header, _, body = cache.read_bytes().partition(b"\n")
+    except OSError:
+        return None
+    if header != key:
+        return None
+    try:
+        return Manifest.model_validate_json(body)
+    except ValidationError:
+        return None
+
+
+def _write_cache(cache: Path, key: bytes, manifest: Manifest) -> None:
+    # Best effort: a read-only checkout just runs uncached.
+    tmp = cache.with_name(f"{cache.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        cache.parent.mkdir(parents=True, exist_ok=True)
+        tmp.write_bytes(key + b"\n" + manifest.model_dump_json().encode("utf-8"))
+        os.replace(tmp, cache)
+    except OSError:
+        tmp.unlink(missing_ok=True)
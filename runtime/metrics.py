@@ -6,12 +6,48 @@ from the audit log.
 
 from __future__ import annotations
 
-from datetime import datetime, timedelta, timezone
+from collections import Counter
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any
 
-from contracts.audit import AuditEntry, AuditEvent
-from runtime.audit.query import _read_all
+from pydantic import TypeAdapter
+from typing_extensions import NotRequired, TypedDict
+
+from contracts.audit import AuditEvent
+
+
+class _MetricRow(TypedDict):
+    """The audit entry fields metrics read; the rest of each line is skipped."""
+
+    ts: datetime
+    request_id: str
+    event: str
+    detail: NotRequired[dict[str, Any]]
+
+
+_ROWS = TypeAdapter(list[_MetricRow])
+# Bytes of log decoded at a time; rows are aggregated and dropped per block.
+_READ_BLOCK = 4 * 1024 * 1024
+
+_REQUEST_START = AuditEvent.REQUEST_START.value
+_REQUEST_END = AuditEvent.REQUEST_END.value
+_TOOL_CALL = AuditEvent.TOOL_CALL.value
+
+
+@dataclass
+class _Aggregate:
+    """Accumulators filled in by a single pass over the audit entries."""
+
+    total: int = 0
+    first_ts: datetime | None = None
+    last_ts: datetime | None = None
+    start_times: list[datetime] = field(default_factory=list)
+    durations: list[float] = field(default_factory=list)
+    tool_counts: Counter[str] = field(default_factory=Counter)
+    event_counts: Counter[str] = field(default_factory=Counter)
 
 
 def compute_metrics(
@@ -21,56 +57,101 @@ def compute_metrics(
     window_seconds: int = 60,
 ) -> dict[str, Any]:
     """Compute aggregated metrics from the audit log."""
-    entries = _read_all(log_path)
-    if since:
-        entries = [e for e in entries if e.ts >= since]
+    agg = _aggregate(_iter_metric_rows(log_path), since)
 
     return {
-        "throughput": _throughput_buckets(entries, window_seconds),
-        "latency": _latency_percentiles(entries),
-        "tool_usage": _tool_usage(entries),
-        "error_rates": _error_rates(entries),
-        "summary": _summary(entries),
+        "throughput": _throughput_buckets(agg.start_times, window_seconds),
+        "latency": _latency_percentiles(agg.durations),
+        "tool_usage": _tool_usage(agg.tool_counts),
+        "error_rates": _error_rates(agg.event_counts),
+        "summary": _summary(agg),
     }
 
 
-def _throughput_buckets(
-    entries: list[AuditEntry], window_seconds: int
-) -> list[dict[str, Any]]:
-    """Bucket request.start events into time windows."""
-    starts = [e for e in entries if e.event == AuditEvent.REQUEST_START]
-    if not starts:
+def _iter_metric_rows(log_path: str | Path) -> Iterator[_MetricRow]:
+    """Stream the log's rows a block at a time, decoding only the fields metrics need.
+
+    Skipping full ``AuditEntry`` validation (enum lookup, defaults for every
+    field) roughly halves the cost of parsing a large log, and nothing is
+    kept once aggregated, so memory doesn't grow with the log.
+    """
+    p = Path(log_path)
+    if not p.exists():
+        return
+    with p.open("rb") as f:
+        rest = b""
+        while block := f.read(_READ_BLOCK):
+            block = rest + block
+            end = block.rfind(b"\n") + 1
+            rest = block[end:]
+            yield from _decode_rows(block[:end])
+        # A final line without its newline is still being written.
+
+
+def _decode_rows(data: bytes) -> list[_MetricRow]:
+    lines = [line for line in data.split(b"\n") if line.strip()]
+    if not lines:
         return []
+    return _ROWS.validate_json(b"[" + b",".join(lines) + b"]")
 
-    starts.sort(key=lambda e: e.ts)
-    bucket_start = starts[0].ts
-    last_ts = starts[-1].ts
-    buckets: list[dict[str, Any]] = []
 
-    while bucket_start <= last_ts:
-        bucket_end = bucket_start + timedelta(seconds=window_seconds)
-        count = sum(1 for e in starts if bucket_start <= e.ts < bucket_end)
-        buckets.append({
-            "time": bucket_start.isoformat(),
-            "count": count,
-        })
-        bucket_start = bucket_end
+def _aggregate(rows: Iterable[_MetricRow], since: datetime | None) -> _Aggregate:
+    """Walk the rows once, updating every accumulator as we go."""
+    agg = _Aggregate()
+    open_starts: dict[str, datetime] = {}
+    event_counts = agg.event_counts
+    tool_counts = agg.tool_counts
 
-    return buckets
+    for row in rows:
+        ts = row["ts"]
+        if since and ts < since:
+            continue
 
+        agg.total += 1
+        if agg.first_ts is None or ts < agg.first_ts:
+            agg.first_ts = ts
+        if agg.last_ts is None or ts > agg.last_ts:
+            agg.last_ts = ts
 
-def _latency_percentiles(entries: list[AuditEntry]) -> dict[str, Any]:
-    """Compute p50/p95/p99 latency by pairing request.start and request.end."""
-    starts: dict[str, datetime] = {}
-    durations: list[float] = []
+        event = row["event"]
+        event_counts[event] += 1
 
-    for e in entries:
-        if e.event == AuditEvent.REQUEST_START:
-            starts[e.request_id] = e.ts
-        elif e.event == AuditEvent.REQUEST_END and e.request_id in starts:
-            dt = (e.ts - starts[e.request_id]).total_seconds()
-            durations.append(dt)
+        if event == _REQUEST_START:
+            agg.start_times.append(ts)
+            open_starts[row["request_id"]] = ts
+        elif event == _REQUEST_END:
+            # Pair with the most recent start seen for this request
+            start = open_starts.get(row["request_id"])
+            if start is not None:
+                agg.durations.append((ts - start).total_seconds())
+        elif event == _TOOL_CALL:
+            tool = row.get("detail", {}).get("tool", "unknown")
+            tool_counts[tool] += 1
 
+    return agg
+
+
+def _throughput_buckets(
+    start_times: list[datetime], window_seconds: int
+) -> list[dict[str, Any]]:
+    """Bucket request.start events into time windows."""
+    if not start_times:
+        return []
+
+    step = timedelta(seconds=window_seconds)
+    first = min(start_times)
+    counts = [0] * ((max(start_times) - first) // step + 1)
+    for ts in start_times:
+        counts[(ts - first) // step] += 1
+
+    return [
+        {"time": (first + i * step).isoformat(), "count": count}
+        for i, count in enumerate(counts)
+    ]
+
+
+def _latency_percentiles(durations: list[float]) -> dict[str, Any]:
+    """Compute p50/p95/p99 latency from paired request.start/request.end."""
     if not durations:
         return {"p50": 0, "p95": 0, "p99": 0, "count": 0}
 
@@ -84,22 +165,16 @@ def _latency_percentiles(entries: list[AuditEntry]) -> dict[str, Any]:
     }
 
 
-def _tool_usage(entries: list[AuditEntry]) -> list[dict[str, Any]]:
-    """Count tool calls by tool name."""
-    counts: dict[str, int] = {}
-    for e in entries:
-        if e.event == AuditEvent.TOOL_CALL:
-            tool = e.detail.get("tool", "unknown")
-            counts[tool] = counts.get(tool, 0) + 1
-
-    return [{"tool": t, "count": c} for t, c in sorted(counts.items(), key=lambda x: -x[1])]
+def _tool_usage(tool_counts: Counter[str]) -> list[dict[str, Any]]:
+    """Tool call counts by tool name, most used first."""
+    return [{"tool": t, "count": c} for t, c in tool_counts.most_common()]
 
 
-def _error_rates(entries: list[AuditEntry]) -> dict[str, Any]:
+def _error_rates(event_counts: Counter[str]) -> dict[str, Any]:
     """Compute error and policy block rates."""
-    total_requests = sum(1 for e in entries if e.event == AuditEvent.REQUEST_START)
-    policy_blocks = sum(1 for e in entries if e.event == AuditEvent.POLICY_BLOCK)
-    tool_calls = sum(1 for e in entries if e.event == AuditEvent.TOOL_CALL)
+    total_requests = event_counts.get(AuditEvent.REQUEST_START.value, 0)
+    policy_blocks = event_counts.get(AuditEvent.POLICY_BLOCK.value, 0)
+    tool_calls = event_counts.get(AuditEvent.TOOL_CALL.value, 0)
 
     return {
         "total_requests": total_requests,
@@ -109,19 +184,14 @@ def _error_rates(entries: list[AuditEntry]) -> dict[str, Any]:
     }
 
 
-def _summary(entries: list[AuditEntry]) -> dict[str, Any]:
+def _summary(agg: _Aggregate) -> dict[str, Any]:
     """High-level summary stats."""
-    if not entries:
+    if not agg.total:
         return {"total_entries": 0, "first_entry": None, "last_entry": None}
 
-    sorted_entries = sorted(entries, key=lambda e: e.ts)
-    event_counts: dict[str, int] = {}
-    for e in entries:
-        event_counts[e.event.value] = event_counts.get(e.event.value, 0) + 1
-
     return {
-        "total_entries": len(entries),
-        "first_entry": sorted_entries[0].ts.isoformat(),
-        "last_entry": sorted_entries[-1].ts.isoformat(),
-        "event_counts": event_counts,
+        "total_entries": agg.total,
+        "first_entry": agg.first_ts.isoformat(),
+        "last_entry": agg.last_ts.isoformat(),
+        "event_counts": dict(agg.event_counts),
     }
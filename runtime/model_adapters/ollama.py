@@ -17,6 +17,11 @@ from contracts.api import Message, Role, ToolCall, ToolCallFunction
 # Models known to NOT support Ollama native tool calling
 _NO_NATIVE_TOOLS = {"gemma3", "gemma2", "gemma"}
 
+# ```json {...} ``` block in prompt-based tool call output
+_JSON_BLOCK = re.compile(r'```(?:json)?\s*(\{.*?\})\s*```', re.DOTALL)
+# "parameters{" / "arguments{" with the quote-colon dropped by the model
+_MISSING_COLON = re.compile(r'"(parameters|arguments)(\{)')
+
 
 def _model_family(model: str) -> str:
     """Extract model family from model name, e.g. 'gemma3:12b' -> 'gemma3'."""
@@ -58,65 +63,113 @@ def _extract_tool_call_from_text(content: str) -> tuple[ToolCall | None, str | N
         return None, content
 
     # Match ```json ... ``` blocks
-    json_block = re.search(r'```(?:json)?\s*(\{.*?\})\s*```', content, re.DOTALL)
+    json_block = _JSON_BLOCK.search(content)
     if json_block:
-        try:
-            parsed = json.loads(json_block.group(1))
-            tc = parsed.get("tool_call")
-            if isinstance(tc, dict) and "name" in tc:
-                args = tc.get("arguments", {})
-                remaining = content[:json_block.start()].strip()
-                if not remaining:
-                    remaining = None
-                return ToolCall(
-                    id="call_0",
-                    type="function",
-                    function=ToolCallFunction(
-                        name=tc["name"],
-                        arguments=json.dumps(args) if isinstance(args, dict) else str(args),
-                    ),
-                ), remaining
-        except (json.JSONDecodeError, KeyError):
-            pass
+        tc = _parse_tool_call(json_block.group(1))
+        if tc:
+            return tc, content[:json_block.start()].strip() or None
 
     # Match bare JSON {"tool_call": ...}
-    bare_match = re.search(r'\{"tool_call"\s*:\s*\{.*?\}\s*\}', content, re.DOTALL)
-    if bare_match:
-        try:
-            parsed = json.loads(bare_match.group(0))
-            tc = parsed.get("tool_call")
-            if isinstance(tc, dict) and "name" in tc:
-                args = tc.get("arguments", {})
-                remaining = content[:bare_match.start()].strip()
-                if not remaining:
-                    remaining = None
-                return ToolCall(
-                    id="call_0",
-                    type="function",
-                    function=ToolCallFunction(
-                        name=tc["name"],
-                        arguments=json.dumps(args) if isinstance(args, dict) else str(args),
-                    ),
-                ), remaining
-        except (json.JSONDecodeError, KeyError):
-            pass
+    span = _find_bare_tool_call(content)
+    if span:
+        tc = _parse_tool_call(content[span[0]:span[1]])
+        if tc:
+            return tc, content[:span[0]].strip() or None
 
     return None, content
 
 
+def _parse_tool_call(raw: str) -> ToolCall | None:
+    """Parse ``{"tool_call": {"name": ..., "arguments": ...}}`` into a ToolCall."""
+    try:
+        parsed = json.loads(raw)
+    except json.JSONDecodeError:
+        return None
+    tc = parsed.get("tool_call") if isinstance(parsed, dict) else None
+    if not isinstance(tc, dict) or "name" not in tc:
+        return None
+    args = tc.get("arguments", {})
+    return ToolCall(
+        id="call_0",
+        type="function",
+        function=ToolCallFunction(
+            name=tc["name"],
+            arguments=json.dumps(args) if isinstance(args, dict) else str(args),
+        ),
+    )
+
+
+def _find_bare_tool_call(content: str) -> tuple[int, int] | None:
+    """Locate a bare ``{"tool_call": ...}`` object and return its (start, end) span.
+
+    Walks forward from the opening brace counting nesting depth (skipping
+    braces inside strings), so nested argument objects are kept whole and
+    there's no regex backtracking over long model output.
+    """
+    start = content.find('{"tool_call"')
+    if start == -1:
+        return None
+
+    depth = 0
+    in_string = escaped = False
+    for i in range(start, len(content)):
+        ch = content[i]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif ch == "\\":
+                escaped = True
+            elif ch == '"':
+                in_string = False
+        elif ch == '"':
+            in_string = True
+        elif ch == "{":
+            depth += 1
+        elif ch == "}":
+            depth -= 1
+            if depth == 0:
+                return start, i + 1
+    return None
+
+
 class OllamaAdapter:
     """Async adapter for the Ollama /api/chat endpoint."""
 
     def __init__(self, base_url: str = "http://localhost:11434") -> None:
         self._base_url = base_url.rstrip("/")
+        self._client: httpx.AsyncClient | None = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the shared client, creating it on first use.
+
+        One long-lived client keeps the connection to Ollama alive across
+        turns instead of reconnecting for every chat call.
+        """
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                timeout=300.0,
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP client, if one was opened."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
 
     async def chat(
         self,
         messages: list[Message],
         model: str,
         tools: list[dict[str, Any]] | None = None,
+        tools_json: bytes | None = None,
     ) -> Message:
-        """Send messages to Ollama and return the assistant response."""
+        """Send messages to Ollama and return the assistant response.
+
+        *tools_json*, if given, is *tools* already serialized as a JSON
+        array; it is sent as-is instead of encoding *tools* again.
+        """
         family = _model_family(model)
         use_native_tools = tools and family not in _NO_NATIVE_TOOLS
 
@@ -139,12 +192,21 @@ class OllamaAdapter:
                 # No system message — prepend one
                 payload["messages"].insert(0, {"role": "system", "content": tool_prompt})
 
-        if use_native_tools:
-            payload["tools"] = tools
-
-        async with httpx.AsyncClient(timeout=300.0) as client:
-            resp = await client.post(f"{self._base_url}/api/chat", json=payload)
-            resp.raise_for_status()
+        url = f"{self._base_url}/api/chat"
+        if use_native_tools and tools_json is not None:
+            # Same encoding httpx uses for json=, with the tools array spliced in
+            body = json.dumps(
+                payload, ensure_ascii=False, separators=(",", ":"), allow_nan=False
+            ).encode()
+            body = body[:-1] + b',"tools":' + tools_json + b"}"
+            resp = await self._get_client().post(
+                url, content=body, headers={"Content-Type": "application/json"}
+            )
+        else:
+            if use_native_tools:
+                payload["tools"] = tools
+            resp = await self._get_client().post(url, json=payload)
+        resp.raise_for_status()
 
         data = resp.json()
         result = self._from_ollama_response(data)
@@ -251,7 +313,7 @@ class OllamaAdapter:
                 # Fix escaped quotes in wrong places: "parameters\":{" -> "parameters":{
                 cleaned = cleaned.replace('\\":{', '":{').replace('\\":', '":')
                 # Fix missing quote and colon: "parameters{" -> "parameters":{
-                cleaned = re.sub(r'"(parameters|arguments)(\{)', r'"\1":\2', cleaned)
+                cleaned = _MISSING_COLON.sub(r'"\1":\2', cleaned)
 
                 parsed = json.loads(cleaned)
                 # Check if it looks like a tool call (has "name" and "arguments" or "parameters")
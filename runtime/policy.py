@@ -5,11 +5,10 @@ Enforces manifest rules for tool calls, data access, and network.
 
 from __future__ import annotations
 
-import fnmatch
-
 from contracts.manifest import Manifest, PolicyMode
 from contracts.policy import PolicyDecision, PolicyEngine, PolicyVerdict
 from contracts.tool_sdk import ToolInput
+from runtime.globs import Globs, compile_globs, first_match
 
 
 class DomeKitPolicyEngine(PolicyEngine):
@@ -17,9 +16,25 @@ class DomeKitPolicyEngine(PolicyEngine):
 
     def __init__(self) -> None:
         self._manifest: Manifest | None = None
+        self._tools_allow: frozenset[str] = frozenset()
+        self._sqlite_allow: frozenset[str] = frozenset()
+        self._allow_domains: frozenset[str] = frozenset()
+        self._globs: dict[str, Globs] = {}
 
     def load_manifest(self, manifest: Manifest) -> None:
         self._manifest = manifest
+        # Allow lists are fixed once loaded: build the lookup sets and
+        # compile the glob patterns here rather than on every check.
+        policy = manifest.policy
+        self._tools_allow = frozenset(policy.tools.allow)
+        self._sqlite_allow = frozenset(policy.data.sqlite.allow)
+        self._allow_domains = frozenset(policy.network.allow_domains)
+        self._globs = {
+            "read": compile_globs(policy.data.filesystem.allow_read),
+            "write": compile_globs(policy.data.filesystem.allow_write),
+            "vector_read": compile_globs(policy.data.vector.allow),
+            "vector_write": compile_globs(policy.data.vector.allow_write),
+        }
 
     @property
     def _mode(self) -> PolicyMode:
@@ -45,8 +60,7 @@ class DomeKitPolicyEngine(PolicyEngine):
                 reason="Developer mode allows all tools",
             )
 
-        allowed = self._manifest.policy.tools.allow
-        if tool_input.tool_name in allowed:
+        if tool_input.tool_name in self._tools_allow:
             return PolicyDecision(
                 verdict=PolicyVerdict.ALLOW,
                 rule="tools.allow",
@@ -77,24 +91,22 @@ class DomeKitPolicyEngine(PolicyEngine):
                 reason="Developer mode allows all data access",
             )
 
-        policy = self._manifest.policy
-
         if access == "read":
             # Check sqlite allow list
-            if path in policy.data.sqlite.allow:
+            if path in self._sqlite_allow:
                 return PolicyDecision(
                     verdict=PolicyVerdict.ALLOW,
                     rule="data.sqlite.allow",
                     reason=f"SQLite path '{path}' is allowed",
                 )
             # Check filesystem allow_read (glob patterns)
-            for pattern in policy.data.filesystem.allow_read:
-                if fnmatch.fnmatch(path, pattern):
-                    return PolicyDecision(
-                        verdict=PolicyVerdict.ALLOW,
-                        rule="data.filesystem.allow_read",
-                        reason=f"Path '{path}' matches read pattern '{pattern}'",
-                    )
+            pattern = first_match(self._globs["read"], path)
+            if pattern is not None:
+                return PolicyDecision(
+                    verdict=PolicyVerdict.ALLOW,
+                    rule="data.filesystem.allow_read",
+                    reason=f"Path '{path}' matches read pattern '{pattern}'",
+                )
             return PolicyDecision(
                 verdict=PolicyVerdict.DENY,
                 rule="data.read",
@@ -102,13 +114,13 @@ class DomeKitPolicyEngine(PolicyEngine):
             )
 
         if access == "write":
-            for pattern in policy.data.filesystem.allow_write:
-                if fnmatch.fnmatch(path, pattern):
-                    return PolicyDecision(
-                        verdict=PolicyVerdict.ALLOW,
-                        rule="data.filesystem.allow_write",
-                        reason=f"Path '{path}' matches write pattern '{pattern}'",
-                    )
+            pattern = first_match(self._globs["write"], path)
+            if pattern is not None:
+                return PolicyDecision(
+                    verdict=PolicyVerdict.ALLOW,
+                    rule="data.filesystem.allow_write",
+                    reason=f"Path '{path}' matches write pattern '{pattern}'",
+                )
             return PolicyDecision(
                 verdict=PolicyVerdict.DENY,
                 rule="data.write",
@@ -116,13 +128,13 @@ class DomeKitPolicyEngine(PolicyEngine):
             )
 
         if access == "vector_read":
-            for pattern in policy.data.vector.allow:
-                if fnmatch.fnmatch(path, pattern):
-                    return PolicyDecision(
-                        verdict=PolicyVerdict.ALLOW,
-                        rule="data.vector.allow",
-                        reason=f"Collection '{path}' matches vector read pattern '{pattern}'",
-                    )
+            pattern = first_match(self._globs["vector_read"], path)
+            if pattern is not None:
+                return PolicyDecision(
+                    verdict=PolicyVerdict.ALLOW,
+                    rule="data.vector.allow",
+                    reason=f"Collection '{path}' matches vector read pattern '{pattern}'",
+                )
             return PolicyDecision(
                 verdict=PolicyVerdict.DENY,
                 rule="data.vector_read",
@@ -130,13 +142,13 @@ class DomeKitPolicyEngine(PolicyEngine):
             )
 
         if access == "vector_write":
-            for pattern in policy.data.vector.allow_write:
-                if fnmatch.fnmatch(path, pattern):
-                    return PolicyDecision(
-                        verdict=PolicyVerdict.ALLOW,
-                        rule="data.vector.allow_write",
-                        reason=f"Collection '{path}' matches vector write pattern '{pattern}'",
-                    )
+            pattern = first_match(self._globs["vector_write"], path)
+            if pattern is not None:
+                return PolicyDecision(
+                    verdict=PolicyVerdict.ALLOW,
+                    rule="data.vector.allow_write",
+                    reason=f"Collection '{path}' matches vector write pattern '{pattern}'",
+                )
             return PolicyDecision(
                 verdict=PolicyVerdict.DENY,
                 rule="data.vector_write",
@@ -177,7 +189,7 @@ class DomeKitPolicyEngine(PolicyEngine):
             )
 
         # outbound == "deny" (default): only allow listed domains
-        if host in network.allow_domains:
+        if host in self._allow_domains:
             return PolicyDecision(
                 verdict=PolicyVerdict.ALLOW,
                 rule="network.allow_domains",
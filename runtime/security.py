@@ -11,6 +11,7 @@ from __future__ import annotations
 
 import re
 from datetime import datetime, timedelta, timezone
+from itertools import pairwise
 from pathlib import Path
 from typing import Any
 
@@ -27,6 +28,8 @@ _SQL_INJECTION_RE = re.compile(
 )
 _BURST_WINDOW_SECONDS = 60
 _BURST_THRESHOLD = 5
+# Distinct entry details whose scan results detect_alerts() remembers
+_SCAN_CACHE_SIZE = 4096
 
 
 def detect_alerts(
@@ -35,91 +38,114 @@ def detect_alerts(
     since: datetime | None = None,
     limit: int = 50,
 ) -> list[dict[str, Any]]:
-    """Run all heuristic detectors and return alerts sorted by time (newest first)."""
-    entries = _read_all(log_path)
-    if since:
-        entries = [e for e in entries if e.ts >= since]
+    """Run all heuristic detectors and return alerts sorted by time (newest first).
+
+    The per-entry detectors share a single pass over the log; the
+    policy.block entries it collects feed the burst and repeated-denial
+    checks afterwards.
+    """
+    traversal: list[dict[str, Any]] = []
+    injection: list[dict[str, Any]] = []
+    blocks: list[AuditEntry] = []
+    tool_counts: dict[str, int] = {}
+    # str(detail) -> (path traversal?, SQL injection?)
+    seen: dict[str, tuple[bool, bool]] = {}
 
-    alerts: list[dict[str, Any]] = []
-    alerts.extend(_detect_path_traversal(entries))
-    alerts.extend(_detect_sql_injection(entries))
-    alerts.extend(_detect_burst_denial(entries))
-    alerts.extend(_detect_repeated_denial(entries))
+    for e in _read_all(log_path):
+        if since and e.ts < since:
+            continue
+        event = e.event
+        if event is not AuditEvent.TOOL_CALL and event is not AuditEvent.POLICY_BLOCK:
+            continue
+
+        detail = e.detail
+        # An empty detail can't hold a path or a query; skip both scans.
+        if detail:
+            # Retries and floods repeat the same arguments; scan each
+            # distinct detail once.
+            text = str(detail)
+            verdict = seen.get(text)
+            if verdict is None:
+                # Only sql_query calls carry a query; skip the regex for the rest.
+                args = detail.get("arguments")
+                query = args.get("query", "") if args else ""
+                verdict = (
+                    _PATH_TRAVERSAL_RE.search(text) is not None,
+                    bool(query) and _SQL_INJECTION_RE.search(query) is not None,
+                )
+                if len(seen) >= _SCAN_CACHE_SIZE:
+                    del seen[next(iter(seen))]  # evict the oldest
+                seen[text] = verdict
+            is_traversal, is_injection = verdict
+            if is_traversal:
+                traversal.append(_alert(
+                    e, "path_traversal", "high", "Path traversal pattern detected in tool arguments"
+                ))
+            if is_injection:
+                query = detail["arguments"]["query"]
+                injection.append(_alert(
+                    e, "sql_injection", "critical", f"SQL injection pattern detected: {query[:120]}"
+                ))
+
+        if event is AuditEvent.POLICY_BLOCK:
+            blocks.append(e)
+            tool = detail.get("tool", "unknown")
+            tool_counts[tool] = tool_counts.get(tool, 0) + 1
+
+    alerts = traversal + injection
+    alerts.extend(_detect_burst_denial(blocks))
+    alerts.extend(_detect_repeated_denial(tool_counts, blocks))
 
     alerts.sort(key=lambda a: a["ts"], reverse=True)
     return alerts[:limit]
 
 
-def _detect_path_traversal(entries: list[AuditEntry]) -> list[dict[str, Any]]:
-    alerts = []
-    for e in entries:
-        if e.event not in (AuditEvent.TOOL_CALL, AuditEvent.POLICY_BLOCK):
-            continue
-        detail_str = str(e.detail)
-        if _PATH_TRAVERSAL_RE.search(detail_str):
-            alerts.append({
-                "type": "path_traversal",
-                "severity": "high",
-                "ts": e.ts.isoformat(),
-                "request_id": e.request_id,
-                "event": e.event.value,
-                "detail": e.detail,
-                "message": "Path traversal pattern detected in tool arguments",
-            })
-    return alerts
+def _alert(e: AuditEntry, kind: str, severity: str, message: str) -> dict[str, Any]:
+    return {
+        "type": kind,
+        "severity": severity,
+        "ts": e.ts.isoformat(),
+        "request_id": e.request_id,
+        "event": e.event.value,
+        "detail": e.detail,
+        "message": message,
+    }
 
 
-def _detect_sql_injection(entries: list[AuditEntry]) -> list[dict[str, Any]]:
-    alerts = []
-    for e in entries:
-        if e.event not in (AuditEvent.TOOL_CALL, AuditEvent.POLICY_BLOCK):
-            continue
-        args = e.detail.get("arguments", {})
-        query = args.get("query", "")
-        if _SQL_INJECTION_RE.search(query):
-            alerts.append({
-                "type": "sql_injection",
-                "severity": "critical",
-                "ts": e.ts.isoformat(),
-                "request_id": e.request_id,
-                "event": e.event.value,
-                "detail": e.detail,
-                "message": f"SQL injection pattern detected: {query[:120]}",
-            })
-    return alerts
-
-
-def _detect_burst_denial(entries: list[AuditEntry]) -> list[dict[str, Any]]:
-    blocks = [e for e in entries if e.event == AuditEvent.POLICY_BLOCK]
+def _detect_burst_denial(blocks: list[AuditEntry]) -> list[dict[str, Any]]:
     if len(blocks) < _BURST_THRESHOLD:
         return []
+    # The log is written in time order; sort only if it somehow isn't.
+    if any(a.ts > b.ts for a, b in pairwise(blocks)):
+        blocks = sorted(blocks, key=lambda b: b.ts)
 
+    # Sliding window: j is one past the last block within the window that
+    # starts at blocks[i], and only ever moves forward.
+    window = timedelta(seconds=_BURST_WINDOW_SECONDS)
     alerts = []
-    for i in range(len(blocks)):
-        window_start = blocks[i].ts
-        window_end = window_start + timedelta(seconds=_BURST_WINDOW_SECONDS)
-        window_blocks = [b for b in blocks[i:] if b.ts <= window_end]
-        if len(window_blocks) >= _BURST_THRESHOLD:
+    j = 0
+    for i, first in enumerate(blocks):
+        window_end = first.ts + window
+        while j < len(blocks) and blocks[j].ts <= window_end:
+            j += 1
+        count = j - i
+        if count >= _BURST_THRESHOLD:
             alerts.append({
                 "type": "burst_denial",
                 "severity": "medium",
-                "ts": blocks[i].ts.isoformat(),
-                "request_id": blocks[i].request_id,
+                "ts": first.ts.isoformat(),
+                "request_id": first.request_id,
                 "event": "policy.block",
-                "detail": {"count": len(window_blocks), "window_seconds": _BURST_WINDOW_SECONDS},
-                "message": f"{len(window_blocks)} policy blocks within {_BURST_WINDOW_SECONDS}s window",
+                "detail": {"count": count, "window_seconds": _BURST_WINDOW_SECONDS},
+                "message": f"{count} policy blocks within {_BURST_WINDOW_SECONDS}s window",
             })
             break  # Report only the first burst
     return alerts
 
 
-def _detect_repeated_denial(entries: list[AuditEntry]) -> list[dict[str, Any]]:
-    blocks = [e for e in entries if e.event == AuditEvent.POLICY_BLOCK]
-    tool_counts: dict[str, int] = {}
-    for b in blocks:
-        tool = b.detail.get("tool", "unknown")
-        tool_counts[tool] = tool_counts.get(tool, 0) + 1
-
+def _detect_repeated_denial(
+    tool_counts: dict[str, int], blocks: list[AuditEntry]
+) -> list[dict[str, Any]]:
     alerts = []
     for tool, count in tool_counts.items():
         if count >= 3:
@@ -2,8 +2,12 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
-import uuid
+import os
+import threading
+from collections.abc import Mapping
+from types import MappingProxyType
 from typing import Any
 
 from contracts.api import (
@@ -12,20 +16,77 @@ from contracts.api import (
     Choice,
     Message,
     Role,
+    ToolCall,
     TraceMeta,
 )
-from contracts.audit import AuditEntry, AuditEvent
+from contracts.audit import AuditEntry, AuditEvent, AuditLogger
 from contracts.manifest import Manifest
 from contracts.policy import PolicyVerdict
 from contracts.tool_sdk import ToolContext, ToolInput
 
-from runtime.audit.logger import JsonlAuditLogger
 from runtime.model_adapters.ollama import OllamaAdapter
 from runtime.policy import DomeKitPolicyEngine
+from runtime.tools.base import resolve_paths
 from runtime.tools.registry import ToolRegistry
 
 MAX_ITERATIONS = 5
 
+# Tools without side effects. Consecutive calls to these within one model
+# turn run concurrently; any other call waits for everything before it.
+_READ_ONLY_TOOLS = frozenset({"sql_query", "read_file", "vector_search"})
+
+
+# Randomness for request ids is drawn in blocks to amortize the syscall.
+_ID_POOL_SIZE = 4096
+_id_pool = b""
+_id_offset = 0
+_id_lock = threading.Lock()
+
+
+def _reset_id_pool() -> None:
+    # A forked child must not hand out the ids left in its parent's pool.
+    global _id_pool, _id_offset
+    _id_pool, _id_offset = b"", 0
+
+
+os.register_at_fork(after_in_child=_reset_id_pool)
+
+
+def _new_request_id() -> str:
+    """Return a random version-4 UUID string without building a ``uuid.UUID``."""
+    global _id_pool, _id_offset
+    with _id_lock:
+        if _id_offset + 16 > len(_id_pool):
+            _id_pool, _id_offset = os.urandom(_ID_POOL_SIZE), 0
+        b = bytearray(_id_pool[_id_offset : _id_offset + 16])
+        _id_offset += 16
+    b[6] = b[6] & 0x0F | 0x40  # version 4
+    b[8] = b[8] & 0x3F | 0x80  # RFC 4122 variant
+    h = b.hex()
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
+
+
+def _manifest_data_paths(manifest: Manifest) -> Mapping[str, Any]:
+    """Collect the manifest settings tools read from ``ctx.manifest_data_paths``."""
+    sql_config = manifest.tools.get("sql_query")
+    read_config = manifest.tools.get("read_file")
+    data = manifest.policy.data
+    return MappingProxyType({
+        "sqlite_allow": data.sqlite.allow,
+        "fs_allow_read": data.filesystem.allow_read,
+        "fs_allow_write": data.filesystem.allow_write,
+        # Resolved once here instead of on every tool call
+        "sqlite_allow_resolved": frozenset(resolve_paths(data.sqlite.allow)),
+        "fs_allow_read_resolved": resolve_paths(data.filesystem.allow_read),
+        "fs_allow_write_resolved": resolve_paths(data.filesystem.allow_write),
+        "max_rows": sql_config.max_rows if sql_config else 100,
+        "max_bytes": read_config.max_bytes if read_config else 65536,
+        "vector_allow": data.vector.allow,
+        "vector_allow_write": data.vector.allow_write,
+        "vector_backend": manifest.vector_db.backend,
+        "default_top_k": manifest.vector_db.default_top_k,
+    })
+
 
 class ToolRouter:
     """Runs the model → tool-call → model loop with policy enforcement."""
@@ -34,17 +95,39 @@ class ToolRouter:
         self,
         policy: DomeKitPolicyEngine,
         registry: ToolRegistry,
-        logger: JsonlAuditLogger,
+        logger: AuditLogger,
         adapter: OllamaAdapter,
     ) -> None:
         self._policy = policy
         self._registry = registry
         self._logger = logger
         self._adapter = adapter
+        # (manifest, data paths) — the manifest is usually the same object
+        # for every request, so its data paths are only collected once.
+        self._data_paths: tuple[Manifest, Mapping[str, Any]] | None = None
+
+    def _data_paths_for(self, manifest: Manifest) -> Mapping[str, Any]:
+        cached = self._data_paths
+        if cached is None or cached[0] is not manifest:
+            cached = self._data_paths = (manifest, _manifest_data_paths(manifest))
+        return cached[1]
+
+    async def _execute(self, ctx: ToolContext, tool_name: str, args: dict[str, Any]) -> str:
+        """Run one tool and return the JSON content of its tool message."""
+        try:
+            tool = self._registry.get(tool_name)
+            output = await tool.run(ctx, args)
+        except KeyError:
+            return json.dumps({"error": f"Unknown tool: {tool_name}"})
+        except Exception as exc:
+            return json.dumps({"error": str(exc)})
+        if output.error:
+            return json.dumps({"error": output.error, "success": False})
+        return json.dumps({"result": output.result, "success": output.success})
 
     async def run(self, request: ChatRequest, manifest: Manifest) -> ChatResponse:
         """Execute the chat completion with tool-calling loop."""
-        request_id = str(uuid.uuid4())
+        request_id = _new_request_id()
         model = manifest.models.default or request.model
         policy_mode = manifest.runtime.policy_mode.value
         app_name = manifest.app.name
@@ -69,13 +152,70 @@ class ToolRouter:
             system_prompt = f"You are {app_name}, a DomeKit-powered assistant."
             messages.insert(0, Message(role=Role.SYSTEM, content=system_prompt))
 
-        # Get tool definitions for the model
+        # Get tool definitions for the model, plus their cached JSON encoding
         tool_defs = self._registry.get_openai_definitions() or None
+        tool_defs_json = self._registry.get_openai_definitions_json() if tool_defs else None
+
+        # One read-only context is shared by every tool call in this request
+        ctx = ToolContext(
+            request_id=request_id,
+            app_name=app_name,
+            policy_mode=policy_mode,
+            manifest_data_paths=self._data_paths_for(manifest),
+        )
+
+        async def run_batch(batch: list[tuple[ToolCall, str, dict[str, Any]]]) -> list[str]:
+            """Run *batch* concurrently; every call is logged before any of them starts."""
+            for _, tool_name, args in batch:
+                # Audit: tool.call
+                self._logger.log(
+                    AuditEntry(
+                        request_id=request_id,
+                        event=AuditEvent.TOOL_CALL,
+                        app=app_name,
+                        model=model,
+                        policy_mode=policy_mode,
+                        detail={"tool": tool_name, "arguments": args},
+                    )
+                )
+            tasks = [
+                asyncio.ensure_future(self._execute(ctx, tool_name, args))
+                for _, tool_name, args in batch
+            ]
+            outputs: list[str] = []
+            try:
+                for (tc, tool_name, args), task in zip(batch, tasks):
+                    outputs.append(await task)
+                    tools_used.append(tool_name)
+
+                    # Track tables for sql_query
+                    if tool_name == "sql_query":
+                        table = args.get("table", "")
+                        if table and table not in tables_queried:
+                            tables_queried.append(table)
+
+                    # Audit: tool.result
+                    self._logger.log(
+                        AuditEntry(
+                            request_id=request_id,
+                            event=AuditEvent.TOOL_RESULT,
+                            app=app_name,
+                            model=model,
+                            policy_mode=policy_mode,
+                            detail={"tool": tool_name, "call_id": tc.id},
+                        )
+                    )
+            finally:
+                for task in tasks:
+                    task.cancel()
+            return outputs
 
         # Tool-calling loop
         last_message = Message(role=Role.ASSISTANT, content="")
         for _ in range(MAX_ITERATIONS):
-            last_message = await self._adapter.chat(messages, model, tools=tool_defs)
+            last_message = await self._adapter.chat(
+                messages, model, tools=tool_defs, tools_json=tool_defs_json
+            )
 
             if not last_message.tool_calls:
                 break
@@ -83,6 +223,11 @@ class ToolRouter:
             # Append assistant message with tool_calls
             messages.append(last_message)
 
+            # Calls are handled in the model's order. Runs of read-only calls
+            # are batched so they execute together; a call that may write
+            # only starts once every earlier call has finished.
+            replies: list[str] = []
+            batch: list[tuple[ToolCall, str, dict[str, Any]]] = []
             for tc in last_message.tool_calls:
                 tool_name = tc.function.name
                 try:
@@ -97,6 +242,13 @@ class ToolRouter:
                 # Policy check
                 decision = self._policy.check_tool(tool_input)
 
+                if decision.verdict != PolicyVerdict.DENY and tool_name in _READ_ONLY_TOOLS:
+                    batch.append((tc, tool_name, args))
+                    continue
+
+                replies += await run_batch(batch)
+                batch = []
+
                 if decision.verdict == PolicyVerdict.DENY:
                     # Log policy block
                     self._logger.log(
@@ -113,90 +265,19 @@ class ToolRouter:
                             },
                         )
                     )
-                    messages.append(
-                        Message(
-                            role=Role.TOOL,
-                            content=json.dumps(
-                                {"error": f"Policy denied: {decision.reason}"}
-                            ),
-                            tool_call_id=tc.id,
-                        )
-                    )
+                    replies.append(json.dumps(
+                        {"error": f"Policy denied: {decision.reason}"}
+                    ))
                     continue
 
-                # Audit: tool.call
-                self._logger.log(
-                    AuditEntry(
-                        request_id=request_id,
-                        event=AuditEvent.TOOL_CALL,
-                        app=app_name,
-                        model=model,
-                        policy_mode=policy_mode,
-                        detail={"tool": tool_name, "arguments": args},
-                    )
-                )
-
-                # Execute tool
-                sql_config = manifest.tools.get("sql_query")
-                read_config = manifest.tools.get("read_file")
-                ctx = ToolContext(
-                    request_id=request_id,
-                    app_name=app_name,
-                    policy_mode=policy_mode,
-                    manifest_data_paths={
-                        "sqlite_allow": manifest.policy.data.sqlite.allow,
-                        "fs_allow_read": manifest.policy.data.filesystem.allow_read,
-                        "fs_allow_write": manifest.policy.data.filesystem.allow_write,
-                        "max_rows": sql_config.max_rows if sql_config else 100,
-                        "max_bytes": read_config.max_bytes if read_config else 65536,
-                        "vector_allow": manifest.policy.data.vector.allow,
-                        "vector_allow_write": manifest.policy.data.vector.allow_write,
-                        "vector_backend": manifest.vector_db.backend,
-                        "default_top_k": manifest.vector_db.default_top_k,
-                    },
-                )
-                try:
-                    tool = self._registry.get(tool_name)
-                    output = await tool.run(ctx, args)
-                except KeyError:
-                    output_content = json.dumps(
-                        {"error": f"Unknown tool: {tool_name}"}
-                    )
-                except Exception as exc:
-                    output_content = json.dumps({"error": str(exc)})
-                else:
-                    output_content = json.dumps(
-                        {"result": output.result, "success": output.success}
-                    )
-                    if output.error:
-                        output_content = json.dumps(
-                            {"error": output.error, "success": False}
-                        )
-
-                tools_used.append(tool_name)
-
-                # Track tables for sql_query
-                if tool_name == "sql_query":
-                    table = args.get("table", "")
-                    if table and table not in tables_queried:
-                        tables_queried.append(table)
-
-                # Audit: tool.result
-                self._logger.log(
-                    AuditEntry(
-                        request_id=request_id,
-                        event=AuditEvent.TOOL_RESULT,
-                        app=app_name,
-                        model=model,
-                        policy_mode=policy_mode,
-                        detail={"tool": tool_name, "call_id": tc.id},
-                    )
-                )
+                replies += await run_batch([(tc, tool_name, args)])
+            replies += await run_batch(batch)
 
+            for tc, reply in zip(last_message.tool_calls, replies):
                 messages.append(
                     Message(
                         role=Role.TOOL,
-                        content=output_content,
+                        content=reply,
                         tool_call_id=tc.id,
                     )
                 )
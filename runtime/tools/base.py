@@ -2,17 +2,76 @@
 
 from __future__ import annotations
 
+import os
+from collections.abc import Iterable
+from functools import lru_cache
 from typing import Any
+from weakref import WeakKeyDictionary
 
 import jsonschema
+from jsonschema.exceptions import best_match
+from jsonschema.protocols import Validator
 
 from contracts.tool_sdk import BaseTool
+from runtime.globs import compile_globs, first_match
+
+# Tool instance -> validator for its input_schema, built on first use
+_VALIDATORS: WeakKeyDictionary[BaseTool, Validator] = WeakKeyDictionary()
 
 
 def validate_args(tool: BaseTool, args: dict[str, Any]) -> None:
     """Validate *args* against the tool's input_schema.
 
-    Raises ``jsonschema.ValidationError`` on invalid input.
+    Raises ``jsonschema.ValidationError`` on invalid input. The schema is
+    checked and its validator built once per tool, rather than on every
+    call as ``jsonschema.validate`` does.
+    """
+    validator = _VALIDATORS.get(tool)
+    if validator is None:
+        schema = tool.definition().input_schema
+        cls = jsonschema.validators.validator_for(schema)
+        cls.check_schema(schema)
+        validator = _VALIDATORS[tool] = cls(schema)
+
+    error = best_match(validator.iter_errors(args))
+    if error is not None:
+        raise error
+
+
+def resolve_paths(paths: Iterable[str]) -> tuple[str, ...]:
+    """Resolve each path to an absolute, symlink-free string.
+
+    ``ToolRouter`` does this once per manifest and passes the results in
+    ``manifest_data_paths`` under ``*_resolved`` keys; tools fall back to
+    calling it themselves when given a context built elsewhere.
+    """
+    return tuple(_realpath(p) for p in paths)
+
+
+# Allow-list entries repeat across calls; the paths being checked are
+# resolved fresh every time so a changed symlink is always seen.
+_realpath = lru_cache(maxsize=1024)(os.path.realpath)
+
+
+def is_within(path: str, prefixes: tuple[str, ...]) -> bool:
+    """Return True if resolved *path* is one of *prefixes* or lies beneath one.
+
+    Matching is by whole path components, so ``/data/app`` does not admit
+    ``/data/app-secrets``.
+    """
+    if path in prefixes:
+        return True
+    return path.startswith(tuple(p if p.endswith(os.sep) else p + os.sep for p in prefixes))
+
+
+# Allow lists repeat across calls; each is compiled once.
+_compiled_globs = lru_cache(maxsize=256)(compile_globs)
+
+
+def matches_any(name: str, patterns: Iterable[str]) -> bool:
+    """Return True if *name* matches any of the fnmatch *patterns*.
+
+    Same result as ``any(fnmatch.fnmatch(name, p) for p in patterns)``, but
+    the patterns are matched as one regex built once per allow list.
     """
-    schema = tool.definition().input_schema
-    jsonschema.validate(instance=args, schema=schema)
+    return first_match(_compiled_globs(tuple(patterns)), name) is not None
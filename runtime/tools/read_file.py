@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
-from pathlib import Path
+import asyncio
+import os
 from typing import Any
 
 from contracts.tool_sdk import BaseTool, ToolContext, ToolDefinition, ToolOutput
+from runtime.tools.base import is_within, resolve_paths
 
 _DEFAULT_MAX_BYTES = 1_048_576  # 1 MB
 
@@ -32,14 +34,13 @@ class ReadFileTool(BaseTool):
         file_path = args["path"]
         call_id = getattr(ctx, "request_id", "")
 
-        allowed_prefixes: list[str] = ctx.manifest_data_paths.get("fs_allow_read", [])
-        resolved = Path(file_path).resolve()
+        allowed_prefixes: tuple[str, ...] | None = ctx.manifest_data_paths.get("fs_allow_read_resolved")
+        if allowed_prefixes is None:
+            allowed_prefixes = resolve_paths(ctx.manifest_data_paths.get("fs_allow_read", []))
+        resolved = os.path.realpath(file_path)
 
-        # Path traversal prevention: resolved path must start with an allowed prefix
-        if not any(
-            str(resolved).startswith(str(Path(prefix).resolve()))
-            for prefix in allowed_prefixes
-        ):
+        # Path traversal prevention: resolved path must lie within an allowed prefix
+        if not is_within(resolved, allowed_prefixes):
             return ToolOutput(
                 call_id=call_id,
                 tool_name="read_file",
@@ -50,7 +51,8 @@ class ReadFileTool(BaseTool):
         max_bytes: int = ctx.manifest_data_paths.get("max_bytes", _DEFAULT_MAX_BYTES)
 
         try:
-            content = resolved.read_bytes()[:max_bytes].decode(errors="replace")
+            data = await asyncio.to_thread(_read_head, resolved, max_bytes)
+            content = data.decode(errors="replace")
         except Exception as exc:
             return ToolOutput(
                 call_id=call_id,
@@ -64,3 +66,9 @@ class ReadFileTool(BaseTool):
             tool_name="read_file",
             result=content,
         )
+
+
+def _read_head(path: str, max_bytes: int) -> bytes:
+    """Read at most *max_bytes* from the start of *path*, never the whole file."""
+    with open(path, "rb") as f:
+        return f.read(max_bytes)
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import json
+
 from contracts.tool_sdk import BaseTool
 
 
@@ -10,11 +12,15 @@ class ToolRegistry:
 
     def __init__(self) -> None:
         self._tools: dict[str, BaseTool] = {}
+        self._openai_defs: list[dict] | None = None
+        self._openai_defs_json: bytes | None = None
 
     def register(self, tool: BaseTool) -> None:
         """Register a tool instance.  Overwrites if name already exists."""
         name = tool.definition().name
         self._tools[name] = tool
+        self._openai_defs = None
+        self._openai_defs_json = None
 
     def get(self, name: str) -> BaseTool:
         """Return a registered tool by name, or raise ``KeyError``."""
@@ -25,7 +31,13 @@ class ToolRegistry:
         return sorted(self._tools)
 
     def get_openai_definitions(self) -> list[dict]:
-        """Export all tools in OpenAI function-calling format."""
+        """Export all tools in OpenAI function-calling format.
+
+        Built once and reused until the next ``register``; the router asks
+        for it on every request, so treat the result as read-only.
+        """
+        if self._openai_defs is not None:
+            return self._openai_defs
         defs: list[dict] = []
         for name in sorted(self._tools):
             defn = self._tools[name].definition()
@@ -39,8 +51,21 @@ class ToolRegistry:
                     },
                 }
             )
+        self._openai_defs = defs
         return defs
 
+    def get_openai_definitions_json(self) -> bytes:
+        """Return ``get_openai_definitions()`` serialized as compact JSON bytes.
+
+        Cached alongside the definitions, so a model adapter can splice it
+        into each request body without re-encoding it.
+        """
+        if self._openai_defs_json is None:
+            self._openai_defs_json = json.dumps(
+                self.get_openai_definitions(), ensure_ascii=False, separators=(",", ":")
+            ).encode()
+        return self._openai_defs_json
+
 
 def create_default_registry(
     embedding_adapter: object | None = None,
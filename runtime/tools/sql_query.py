@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
+import asyncio
+import os
 import sqlite3
-from pathlib import Path
+import threading
 from typing import Any
 
 from contracts.tool_sdk import BaseTool, ToolContext, ToolDefinition, ToolOutput
+from runtime.tools.base import resolve_paths
 
 _DEFAULT_MAX_ROWS = 100
 
@@ -36,9 +39,11 @@ class SqlQueryTool(BaseTool):
         call_id = getattr(ctx, "request_id", "")
 
         # Validate db_path against allowed SQLite paths from manifest
-        allowed: list[str] = ctx.manifest_data_paths.get("sqlite_allow", [])
-        resolved = str(Path(db_path).resolve())
-        if not any(resolved == str(Path(a).resolve()) for a in allowed):
+        allowed: frozenset[str] | None = ctx.manifest_data_paths.get("sqlite_allow_resolved")
+        if allowed is None:
+            allowed = frozenset(resolve_paths(ctx.manifest_data_paths.get("sqlite_allow", [])))
+        resolved = os.path.realpath(db_path)
+        if resolved not in allowed:
             return ToolOutput(
                 call_id=call_id,
                 tool_name="sql_query",
@@ -49,15 +54,8 @@ class SqlQueryTool(BaseTool):
         max_rows: int = ctx.manifest_data_paths.get("max_rows", _DEFAULT_MAX_ROWS)
 
         try:
-            conn = sqlite3.connect(f"file:{resolved}?mode=ro", uri=True)
-            try:
-                cursor = conn.execute(query)
-                columns = [desc[0] for desc in cursor.description] if cursor.description else []
-                all_rows = cursor.fetchmany(max_rows + 1)
-                truncated = len(all_rows) > max_rows
-                rows = [list(r) for r in all_rows[:max_rows]]
-            finally:
-                conn.close()
+            # sqlite3 blocks; keep it off the event loop
+            columns, rows, truncated = await asyncio.to_thread(_run_query, resolved, query, max_rows)
         except Exception as exc:
             return ToolOutput(
                 call_id=call_id,
@@ -71,3 +69,105 @@ class SqlQueryTool(BaseTool):
             tool_name="sql_query",
             result={"columns": columns, "rows": rows, "truncated": truncated},
         )
+
+
+def _run_query(db_path: str, query: str, max_rows: int) -> tuple[list[str], list[tuple[Any, ...]], bool]:
+    """Run *query* read-only and return (columns, rows, truncated)."""
+    conn = _checkout(db_path)
+    try:
+        cursor = conn.execute(query)
+        try:
+            columns = [desc[0] for desc in cursor.description] if cursor.description else []
+            all_rows = cursor.fetchmany(max_rows + 1)
+        finally:
+            cursor.close()
+        truncated = len(all_rows) > max_rows
+        if truncated:
+            del all_rows[max_rows:]
+        # Rows stay as tuples; they serialize to JSON arrays all the same.
+        return columns, all_rows, truncated
+    finally:
+        _checkin(db_path, conn)
+
+
+# ── connection pool ─────────────────────────────────────────────────
+#
+# Opening a database per call pays for the open and a cold page cache
+# every time. Idle read-only connections are kept per database file and
+# handed to one query at a time; a pooled connection is dropped if the
+# file at that path has been replaced since it was opened.
+#
+# Because a connection outlives the call that used it, every statement
+# goes through _authorize: only reads are allowed, so a query can't ATTACH
+# another file (or otherwise change connection state) for a later call to
+# use. _checkin also refuses any connection with more than "main" open.
+
+_MAX_IDLE_PER_DB = 4
+
+# Schema-introspection pragmas a query may run; all others are denied.
+_READ_PRAGMAS = frozenset({
+    "database_list",
+    "foreign_key_list",
+    "index_info",
+    "index_list",
+    "index_xinfo",
+    "table_info",
+    "table_list",
+    "table_xinfo",
+})
+_READ_ACTIONS = frozenset({
+    sqlite3.SQLITE_SELECT,
+    sqlite3.SQLITE_READ,
+    sqlite3.SQLITE_FUNCTION,
+    sqlite3.SQLITE_RECURSIVE,
+})
+
+# resolved path -> idle (connection, inode it was opened on)
+_IDLE: dict[str, list[tuple[sqlite3.Connection, int]]] = {}
+_POOL_LOCK = threading.Lock()
+
+
+def _authorize(
+    action: int, arg1: str | None, arg2: str | None, db: str | None, source: str | None,
+) -> int:
+    if action in _READ_ACTIONS:
+        return sqlite3.SQLITE_OK
+    if action == sqlite3.SQLITE_PRAGMA and arg1 and arg1.lower() in _READ_PRAGMAS:
+        return sqlite3.SQLITE_OK
+    return sqlite3.SQLITE_DENY
+
+
+def _checkout(db_path: str) -> sqlite3.Connection:
+    ino = os.stat(db_path).st_ino
+    with _POOL_LOCK:
+        idle = _IDLE.get(db_path, [])
+        while idle:
+            conn, conn_ino = idle.pop()
+            if conn_ino == ino:
+                return conn
+            conn.close()
+    conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True, check_same_thread=False)
+    conn.execute("PRAGMA query_only = 1")
+    conn.set_authorizer(_authorize)
+    return conn
+
+
+def _checkin(db_path: str, conn: sqlite3.Connection) -> None:
+    try:
+        # Don't let a query's open transaction pin an old snapshot.
+        if conn.in_transaction:
+            conn.rollback()
+        # Only ever pool a connection that sees nothing but its own file.
+        if len(conn.execute("PRAGMA database_list").fetchall()) != 1:
+            conn.close()
+            return
+        ino = os.stat(db_path).st_ino
+    except (sqlite3.Error, OSError):
+        conn.close()
+        return
+    with _POOL_LOCK:
+        idle = _IDLE.setdefault(db_path, [])
+        if len(idle) < _MAX_IDLE_PER_DB:
+            idle.append((conn, ino))
+            return
+    conn.close()
@@ -2,12 +2,20 @@
 
 from __future__ import annotations
 
-import fnmatch
+import asyncio
+from collections import OrderedDict
+from hashlib import blake2b
 from typing import Any
 
 from contracts.embedding import EmbeddingAdapter
 from contracts.tool_sdk import BaseTool, ToolContext, ToolDefinition, ToolOutput
 from contracts.vector_db import Document, VectorDBAdapter
+from runtime.tools.base import matches_any
+
+# Inserts larger than this are split into chunks written concurrently
+_INSERT_CHUNK_SIZE = 512
+# Embeddings remembered per tool, keyed by a digest of the document text
+_EMBED_CACHE_SIZE = 512
 
 
 class VectorManageTool(BaseTool):
@@ -20,6 +28,9 @@ class VectorManageTool(BaseTool):
     ) -> None:
         self._embedding = embedding_adapter
         self._vector = vector_adapter
+        # text digest -> embedding, least recently used first. The adapter
+        # (and so the model) is fixed for the tool's lifetime.
+        self._embed_cache: OrderedDict[bytes, list[float]] = OrderedDict()
 
     def definition(self) -> ToolDefinition:
         return ToolDefinition(
@@ -66,7 +77,7 @@ class VectorManageTool(BaseTool):
 
         # Validate collection path against manifest write policy
         allowed: list[str] = ctx.manifest_data_paths.get("vector_allow_write", [])
-        if not any(fnmatch.fnmatch(collection, pattern) for pattern in allowed):
+        if not matches_any(collection, allowed):
             return ToolOutput(
                 call_id=call_id,
                 tool_name="vector_manage",
@@ -99,23 +110,46 @@ class VectorManageTool(BaseTool):
         )
 
     async def _auto_embed(self, documents: list[Document]) -> list[Document]:
-        """Embed documents that don't already have embeddings."""
+        """Embed documents that don't already have embeddings.
+
+        Texts embedded before are served from the cache, and each distinct
+        remaining text is sent to the embedding adapter only once.
+        """
         if self._embedding is None:
             return documents
 
-        texts_to_embed: list[str] = []
-        indices: list[int] = []
+        cache = self._embed_cache
+        found: dict[bytes, list[float]] = {}
+        misses: dict[bytes, str] = {}
+        keys: list[tuple[int, bytes]] = []
         for i, doc in enumerate(documents):
             if doc.embedding is None:
-                texts_to_embed.append(doc.text)
-                indices.append(i)
-
-        if not texts_to_embed:
+                key = blake2b(doc.text.encode(), digest_size=16).digest()
+                keys.append((i, key))
+                emb = cache.get(key)
+                if emb is not None:
+                    cache.move_to_end(key)
+                    found[key] = emb
+                else:
+                    misses[key] = doc.text
+
+        if not keys:
             return documents
 
-        embeddings = await self._embedding.embed(texts_to_embed)
-        for idx, emb in zip(indices, embeddings):
-            documents[idx] = documents[idx].model_copy(update={"embedding": emb})
+        if misses:
+            embeddings = await self._embedding.embed(list(misses.values()))
+            for key, emb in zip(misses, embeddings):
+                found[key] = cache[key] = emb
+            while len(cache) > _EMBED_CACHE_SIZE:
+                cache.popitem(last=False)
+
+        # The handlers build these documents themselves, so set the field in
+        # place rather than copying each model (Document doesn't validate
+        # on assignment).
+        for idx, key in keys:
+            emb = found.get(key)
+            if emb is not None:
+                documents[idx].embedding = emb
 
         return documents
 
@@ -143,7 +177,7 @@ class VectorManageTool(BaseTool):
             )
 
         try:
-            inserted_ids = await self._vector.insert(collection, documents)
+            inserted_ids = await self._insert_chunked(collection, documents)
         except Exception as exc:
             return ToolOutput(
                 call_id=call_id,
@@ -158,6 +192,48 @@ class VectorManageTool(BaseTool):
             result={"operation": "insert", "ids": inserted_ids, "count": len(inserted_ids)},
         )
 
+    async def _insert_chunked(self, collection: str, documents: list[Document]) -> list[str]:
+        """Insert *documents*, splitting large batches into concurrent chunks.
+
+        The first chunk goes in alone so a missing collection is created
+        exactly once; the rest run side by side on the adapter's worker
+        threads. Inserted ids come back in document order.
+
+        Chunks commit separately, so the insert is not atomic: if any chunk
+        fails, the ids already written are deleted again (best effort)
+        before the error is raised.
+        """
+        chunks = [
+            documents[i : i + _INSERT_CHUNK_SIZE]
+            for i in range(0, len(documents), _INSERT_CHUNK_SIZE)
+        ]
+        first = await self._vector.insert(collection, chunks[0])
+        if len(chunks) == 1:
+            return first
+        # Let every chunk finish before reporting a failure, so no insert is
+        # still running behind the error.
+        results = await asyncio.gather(
+            *(self._vector.insert(collection, chunk) for chunk in chunks[1:]),
+            return_exceptions=True,
+        )
+        ids = list(first)
+        failure: BaseException | None = None
+        for result in results:
+            if isinstance(result, BaseException):
+                failure = failure or result
+            else:
+                ids.extend(result)
+        if failure is None:
+            return ids
+
+        try:
+            await self._vector.delete(collection, ids)
+        except Exception as exc:
+            raise RuntimeError(
+                f"{failure}; rolling back {len(ids)} inserted documents also failed: {exc}"
+            ) from failure
+        raise failure
+
     async def _handle_update(
         self, call_id: str, collection: str, ids: list[str], raw_documents: list[dict],
     ) -> ToolOutput:
@@ -2,12 +2,69 @@
 
 from __future__ import annotations
 
-import fnmatch
+import asyncio
 from typing import Any
 
 from contracts.embedding import EmbeddingAdapter
 from contracts.tool_sdk import BaseTool, ToolContext, ToolDefinition, ToolOutput
 from contracts.vector_db import VectorDBAdapter
+from runtime.tools.base import matches_any
+
+# Most queries coalesced into one embedding call
+_EMBED_BATCH_SIZE = 32
+
+
+class _EmbedBatcher:
+    """Coalesce concurrent single-text embeddings into batched calls.
+
+    Texts submitted during one event-loop pass (e.g. tool calls dispatched
+    together by the router) are sent in one ``embed`` call on the next
+    pass, or as soon as ``_EMBED_BATCH_SIZE`` are waiting. No time window
+    is added, so a lone query is not delayed.
+    """
+
+    def __init__(self, adapter: EmbeddingAdapter) -> None:
+        self._adapter = adapter
+        self._pending: list[tuple[str, asyncio.Future[list[float]]]] = []
+        self._flush_handle: asyncio.Handle | None = None
+        # Strong references so in-flight batches aren't garbage collected
+        self._inflight: set[asyncio.Task[None]] = set()
+
+    async def submit(self, text: str) -> list[float]:
+        loop = asyncio.get_running_loop()
+        fut: asyncio.Future[list[float]] = loop.create_future()
+        self._pending.append((text, fut))
+        if len(self._pending) >= _EMBED_BATCH_SIZE:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_soon(self._flush)
+        return await fut
+
+    def _flush(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        batch, self._pending = self._pending, []
+        if batch:
+            task = asyncio.ensure_future(self._embed(batch))
+            self._inflight.add(task)
+            task.add_done_callback(self._inflight.discard)
+
+    async def _embed(self, batch: list[tuple[str, asyncio.Future[list[float]]]]) -> None:
+        try:
+            vectors = await self._adapter.embed([text for text, _ in batch])
+            if len(vectors) != len(batch):
+                raise RuntimeError(
+                    f"expected {len(batch)} embeddings, got {len(vectors)}"
+                )
+        except Exception as exc:
+            for _, fut in batch:
+                if not fut.done():
+                    fut.set_exception(exc)
+            return
+        for (_, fut), vector in zip(batch, vectors):
+            if not fut.done():
+                fut.set_result(vector)
 
 
 class VectorSearchTool(BaseTool):
@@ -20,6 +77,7 @@ class VectorSearchTool(BaseTool):
     ) -> None:
         self._embedding = embedding_adapter
         self._vector = vector_adapter
+        self._batcher = _EmbedBatcher(embedding_adapter) if embedding_adapter else None
 
     def definition(self) -> ToolDefinition:
         return ToolDefinition(
@@ -67,7 +125,7 @@ class VectorSearchTool(BaseTool):
 
         # Validate collection path against manifest
         allowed: list[str] = ctx.manifest_data_paths.get("vector_allow", [])
-        if not any(fnmatch.fnmatch(collection, pattern) for pattern in allowed):
+        if not matches_any(collection, allowed):
             return ToolOutput(
                 call_id=call_id,
                 tool_name="vector_search",
@@ -94,7 +152,7 @@ class VectorSearchTool(BaseTool):
 
         # Convert text query to vector if needed
         if query and not query_vector:
-            if self._embedding is None:
+            if self._batcher is None:
                 return ToolOutput(
                     call_id=call_id,
                     tool_name="vector_search",
@@ -102,8 +160,7 @@ class VectorSearchTool(BaseTool):
                     success=False,
                 )
             try:
-                vectors = await self._embedding.embed([query])
-                query_vector = vectors[0]
+                query_vector = await self._batcher.submit(query)
             except Exception as exc:
                 return ToolOutput(
                     call_id=call_id,
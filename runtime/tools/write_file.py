@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
+import asyncio
+import os
 from pathlib import Path
 from typing import Any
 
 from contracts.tool_sdk import BaseTool, ToolContext, ToolDefinition, ToolOutput
+from runtime.tools.base import is_within, resolve_paths
 
 _DEFAULT_MAX_BYTES = 1_048_576  # 1 MB
 
@@ -34,14 +37,13 @@ class WriteFileTool(BaseTool):
         content = args["content"]
         call_id = getattr(ctx, "request_id", "")
 
-        allowed_prefixes: list[str] = ctx.manifest_data_paths.get("fs_allow_write", [])
-        resolved = Path(file_path).resolve()
+        allowed_prefixes: tuple[str, ...] | None = ctx.manifest_data_paths.get("fs_allow_write_resolved")
+        if allowed_prefixes is None:
+            allowed_prefixes = resolve_paths(ctx.manifest_data_paths.get("fs_allow_write", []))
+        resolved = os.path.realpath(file_path)
 
         # Path traversal prevention
-        if not any(
-            str(resolved).startswith(str(Path(prefix).resolve()))
-            for prefix in allowed_prefixes
-        ):
+        if not is_within(resolved, allowed_prefixes):
             return ToolOutput(
                 call_id=call_id,
                 tool_name="write_file",
@@ -50,7 +52,10 @@ class WriteFileTool(BaseTool):
             )
 
         max_bytes: int = ctx.manifest_data_paths.get("max_bytes", _DEFAULT_MAX_BYTES)
-        if len(content.encode()) > max_bytes:
+        # Every character is at least one UTF-8 byte, so content with more
+        # characters than max_bytes is rejected without encoding it.
+        data = None if len(content) > max_bytes else content.encode()
+        if data is None or len(data) > max_bytes:
             return ToolOutput(
                 call_id=call_id,
                 tool_name="write_file",
@@ -59,8 +64,7 @@ class WriteFileTool(BaseTool):
             )
 
         try:
-            resolved.parent.mkdir(parents=True, exist_ok=True)
-            resolved.write_text(content)
+            await asyncio.to_thread(_write, resolved, data)
         except Exception as exc:
             return ToolOutput(
                 call_id=call_id,
@@ -72,5 +76,11 @@ class WriteFileTool(BaseTool):
         return ToolOutput(
             call_id=call_id,
             tool_name="write_file",
-            result={"status": "ok", "bytes_written": len(content.encode())},
+            result={"status": "ok", "bytes_written": len(data)},
         )
+
+
+def _write(path: str, data: bytes) -> None:
+    target = Path(path)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    target.write_bytes(data)
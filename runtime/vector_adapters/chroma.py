@@ -6,7 +6,9 @@ Wraps chromadb.PersistentClient for local persistent vector storage.
 from __future__ import annotations
 
 import asyncio
+import threading
 import uuid
+from itertools import repeat
 from typing import Any
 
 import chromadb
@@ -14,14 +16,33 @@ import chromadb
 from contracts.vector_db import Document, SearchResult, VectorDBAdapter
 
 
+def _column(result: Any, key: str, n: int, fill: Any) -> list[Any]:
+    """Return the first query's *key* column from a Chroma result, padded to *n*."""
+    column = result.get(key, [[]])[0]
+    if len(column) < n:
+        column = [*column, *repeat(fill, n - len(column))]
+    return column
+
+
 class ChromaVectorAdapter(VectorDBAdapter):
     """Vector adapter backed by ChromaDB with on-disk persistence."""
 
     def __init__(self, persist_path: str) -> None:
         self._client = chromadb.PersistentClient(path=persist_path)
+        # Collection handles by name. Reads are a plain dict lookup; only
+        # the first use of a name takes the lock.
+        self._collections: dict[str, chromadb.Collection] = {}
+        self._collections_lock = threading.Lock()
 
     def _get_or_create_collection(self, name: str) -> chromadb.Collection:
-        return self._client.get_or_create_collection(name=name)
+        col = self._collections.get(name)
+        if col is None:
+            with self._collections_lock:
+                col = self._collections.get(name)
+                if col is None:
+                    col = self._client.get_or_create_collection(name=name)
+                    self._collections[name] = col
+        return col
 
     # ── search ────────────────────────────────────────────────────────
 
@@ -39,22 +60,16 @@ class ChromaVectorAdapter(VectorDBAdapter):
                 n_results=top_k,
                 where=filters or None,
             )
-            results: list[SearchResult] = []
             ids = result.get("ids", [[]])[0]
-            documents = result.get("documents", [[]])[0]
-            metadatas = result.get("metadatas", [[]])[0]
-            distances = result.get("distances", [[]])[0]
-            for i, doc_id in enumerate(ids):
-                distance = distances[i] if i < len(distances) else 0.0
-                results.append(
-                    SearchResult(
-                        id=doc_id,
-                        text=documents[i] if i < len(documents) else "",
-                        metadata=metadatas[i] if i < len(metadatas) else {},
-                        score=1.0 / (1.0 + distance),
-                    )
-                )
-            return results
+            n = len(ids)
+            # Pad short columns once, then build every result in one pass.
+            documents = _column(result, "documents", n, "")
+            metadatas = _column(result, "metadatas", n, {})
+            distances = _column(result, "distances", n, 0.0)
+            return [
+                SearchResult(id=doc_id, text=text, metadata=metadata, score=1.0 / (1.0 + distance))
+                for doc_id, text, metadata, distance in zip(ids, documents, metadatas, distances)
+            ]
 
         return await asyncio.to_thread(_search)
 
@@ -6,15 +6,41 @@ Wraps lancedb for local embedded vector storage with Lance columnar format.
 from __future__ import annotations
 
 import asyncio
-import json
 import uuid
 from typing import Any
 
 import lancedb
+import pyarrow as pa
+from pydantic_core import from_json, to_json
 
 from contracts.vector_db import Document, SearchResult, VectorDBAdapter
 
 
+def _sql_string(value: str) -> str:
+    """Quote *value* as a SQL string literal, doubling embedded quotes."""
+    return "'" + value.replace("'", "''") + "'"
+
+
+def _to_arrow(ids: list[str], documents: list[Document]) -> pa.Table:
+    """Build the rows for *documents* as one columnar Arrow table.
+
+    Handing lancedb columns directly skips its per-row dict conversion and
+    type inference. The schema matches what lancedb infers from row dicts:
+    string id/text/metadata (JSON-encoded) and, when any document carries
+    an embedding, a fixed-size float32 ``vector`` column.
+    """
+    columns: dict[str, pa.Array] = {
+        "id": pa.array(ids, pa.string()),
+        "text": pa.array([doc.text for doc in documents], pa.string()),
+        "metadata": pa.array([to_json(doc.metadata).decode() for doc in documents], pa.string()),
+    }
+    vectors = [doc.embedding for doc in documents]
+    dim = next((len(v) for v in vectors if v is not None), None)
+    if dim is not None:
+        columns["vector"] = pa.array(vectors, pa.list_(pa.float32(), dim))
+    return pa.table(columns)
+
+
 class LanceVectorAdapter(VectorDBAdapter):
     """Vector adapter backed by LanceDB with on-disk Lance tables."""
 
@@ -47,7 +73,7 @@ class LanceVectorAdapter(VectorDBAdapter):
                 distance = row.get("_distance", 0.0)
                 metadata_raw = row.get("metadata", "{}")
                 if isinstance(metadata_raw, str):
-                    metadata = json.loads(metadata_raw)
+                    metadata = from_json(metadata_raw)
                 else:
                     metadata = metadata_raw
                 results.append(
@@ -68,19 +94,8 @@ class LanceVectorAdapter(VectorDBAdapter):
         self, collection: str, documents: list[Document]
     ) -> list[str]:
         def _insert() -> list[str]:
-            ids: list[str] = []
-            data: list[dict[str, Any]] = []
-            for doc in documents:
-                doc_id = doc.id or str(uuid.uuid4())
-                ids.append(doc_id)
-                row: dict[str, Any] = {
-                    "id": doc_id,
-                    "text": doc.text,
-                    "metadata": json.dumps(doc.metadata),
-                }
-                if doc.embedding is not None:
-                    row["vector"] = doc.embedding
-                data.append(row)
+            ids = [doc.id or str(uuid.uuid4()) for doc in documents]
+            data = _to_arrow(ids, documents)
 
             table_names = self._db.table_names()
             if collection in table_names:
@@ -98,18 +113,17 @@ class LanceVectorAdapter(VectorDBAdapter):
         self, collection: str, ids: list[str], documents: list[Document]
     ) -> None:
         def _update() -> None:
+            # Later entries win when an id repeats, as with one-by-one updates.
+            latest = dict(zip(ids, documents))
             table = self._db.open_table(collection)
-            for doc_id, doc in zip(ids, documents):
-                # LanceDB lacks row-level update; delete and re-insert
-                table.delete(f"id = '{doc_id}'")
-                row: dict[str, Any] = {
-                    "id": doc_id,
-                    "text": doc.text,
-                    "metadata": json.dumps(doc.metadata),
-                }
-                if doc.embedding is not None:
-                    row["vector"] = doc.embedding
-                table.add([row])
+            # One upsert rewrites the affected fragments once, rather than a
+            # delete plus an add per document.
+            (
+                table.merge_insert("id")
+                .when_matched_update_all()
+                .when_not_matched_insert_all()
+                .execute(_to_arrow(list(latest), list(latest.values())))
+            )
 
         await asyncio.to_thread(_update)
 
@@ -118,8 +132,8 @@ class LanceVectorAdapter(VectorDBAdapter):
     async def delete(self, collection: str, ids: list[str]) -> None:
         def _delete() -> None:
             table = self._db.open_table(collection)
-            formatted_ids = ", ".join(f"'{i}'" for i in ids)
-            table.delete(f"id IN ({formatted_ids})")
+            # lancedb only takes a SQL predicate; build it in one join.
+            table.delete("id IN (" + ",".join(map(_sql_string, ids)) + ")")
 
         await asyncio.to_thread(_delete)
 
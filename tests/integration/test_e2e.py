@@ -211,3 +211,19 @@ class TestE2E:
         resp = client.get("/v1/domekit/health")
         assert resp.status_code == 200
         assert resp.json()["status"] == "ok"
+
+    def test_cors_allows_only_local_origins(self, client: TestClient) -> None:
+        """CORS echoes localhost origins (any port) and rejects others."""
+        ok = client.get("/v1/domekit/health", headers={"Origin": "http://localhost:5173"})
+        assert ok.headers["access-control-allow-origin"] == "http://localhost:5173"
+
+        bad = client.get("/v1/domekit/health", headers={"Origin": "http://evil.example"})
+        assert "access-control-allow-origin" not in bad.headers
+
+    def test_chat_rejects_invalid_body(self, client: TestClient) -> None:
+        """Malformed chat bodies still get FastAPI's 422 validation response."""
+        resp = client.post(
+            "/v1/chat/completions", json={"messages": [{"role": "bogus"}]}
+        )
+        assert resp.status_code == 422
+        assert resp.json()["detail"][0]["loc"] == ["body", "messages", 0, "role"]
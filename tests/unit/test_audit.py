@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import asyncio
 import tempfile
+from collections import OrderedDict
 from pathlib import Path
 
 import pytest
@@ -41,6 +43,37 @@ class TestJsonlAuditLogger:
         lines = log_file.read_text().strip().split("\n")
         assert len(lines) == 2
 
+    def test_concurrent_logs_stay_line_atomic(self, tmp_path: Path) -> None:
+        from concurrent.futures import ThreadPoolExecutor
+
+        log_file = tmp_path / "audit.jsonl"
+        logger = JsonlAuditLogger(log_file)
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(lambda i: logger.log(_entry(request_id=f"r{i}")), range(200)))
+        logger.close()
+
+        entries = logger.tail(500)
+        assert sorted(e.request_id for e in entries) == sorted(f"r{i}" for i in range(200))
+
+    def test_reopens_after_rename_rotation(self, tmp_path: Path) -> None:
+        log_file = tmp_path / "audit.jsonl"
+        logger = JsonlAuditLogger(log_file)
+        logger.log(_entry(request_id="old"))
+        log_file.rename(tmp_path / "audit.jsonl.1")
+
+        logger.log(_entry(request_id="new"))
+        assert [e.request_id for e in logger.tail(10)] == ["new"]
+        assert "new" not in (tmp_path / "audit.jsonl.1").read_text()
+
+    def test_reopens_after_removal(self, tmp_path: Path) -> None:
+        log_file = tmp_path / "audit.jsonl"
+        logger = JsonlAuditLogger(log_file)
+        logger.log(_entry(request_id="old"))
+        log_file.unlink()
+
+        logger.log(_entry(request_id="new"))
+        assert [e.request_id for e in logger.tail(10)] == ["new"]
+
     def test_query_by_request(self, tmp_path: Path) -> None:
         log_file = tmp_path / "audit.jsonl"
         logger = JsonlAuditLogger(log_file)
@@ -88,6 +121,19 @@ class TestJsonlAuditLogger:
         results = logger.tail(5)
         assert results == []
 
+    def test_tail_spans_blocks(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        import runtime.audit.logger as logger_mod
+
+        monkeypatch.setattr(logger_mod, "_TAIL_BLOCK", 64)
+        log_file = tmp_path / "audit.jsonl"
+        logger = JsonlAuditLogger(log_file)
+        for i in range(10):
+            logger.log(_entry(request_id=f"r{i}"))
+
+        results = logger.tail(4)
+        assert [e.request_id for e in results] == ["r6", "r7", "r8", "r9"]
+        assert len(logger.tail(50)) == 10
+
 
 # ── standalone query function tests ─────────────────────────────────
 
@@ -102,6 +148,15 @@ class TestAuditQueryFunctions:
         results = audit_query.query_by_request(log_file, "r1")
         assert len(results) == 1
 
+    def test_query_by_request_ignores_match_in_detail(self, tmp_path: Path) -> None:
+        log_file = tmp_path / "audit.jsonl"
+        logger = JsonlAuditLogger(log_file)
+        logger.log(AuditEntry(request_id="r2", event=AuditEvent.TOOL_CALL, detail={"request_id": "r1"}))
+        logger.log(_entry(request_id="r1"))
+
+        results = audit_query.query_by_request(log_file, "r1")
+        assert [e.request_id for e in results] == ["r1"]
+
     def test_query_by_event(self, tmp_path: Path) -> None:
         log_file = tmp_path / "audit.jsonl"
         logger = JsonlAuditLogger(log_file)
@@ -121,8 +176,314 @@ class TestAuditQueryFunctions:
         assert len(results) == 2
         assert results[0].request_id == "r3"
 
+    def test_query_filtered_combines_filters(self, tmp_path: Path) -> None:
+        from datetime import datetime, timedelta, timezone
+
+        log_file = tmp_path / "audit.jsonl"
+        logger = JsonlAuditLogger(log_file)
+        t0 = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        for i in range(6):
+            logger.log(AuditEntry(
+                ts=t0 + timedelta(minutes=i),
+                request_id=f"r{i % 2}",
+                event=AuditEvent.TOOL_CALL if i % 3 else AuditEvent.REQUEST_START,
+            ))
+
+        page, total = audit_query.query_filtered(
+            log_file, event=AuditEvent.TOOL_CALL, since=t0 + timedelta(minutes=2)
+        )
+        assert total == 3
+        assert [e.ts.minute for e in page] == [5, 4, 2]
+
+        page, total = audit_query.query_filtered(
+            log_file, request_id="r1", until=t0 + timedelta(minutes=3)
+        )
+        assert total == 2
+        assert [e.ts.minute for e in page] == [3, 1]
+
+    def test_query_filtered_pages_newest_first(self, tmp_path: Path) -> None:
+        from datetime import datetime, timedelta, timezone
+
+        log_file = tmp_path / "audit.jsonl"
+        logger = JsonlAuditLogger(log_file)
+        t0 = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        # Out of order on disk: the page must still be ranked by ts
+        for minute in (3, 0, 4, 1, 2):
+            logger.log(AuditEntry(ts=t0 + timedelta(minutes=minute), request_id=f"r{minute}", event=AuditEvent.TOOL_CALL))
+
+        page, total = audit_query.query_filtered(log_file, limit=2, offset=1)
+        assert total == 5
+        assert [e.request_id for e in page] == ["r3", "r2"]
+        assert audit_query.query_filtered(log_file, offset=10)[0] == []
+
+    def test_count_entries_incremental(self, tmp_path: Path) -> None:
+        log_file = tmp_path / "audit.jsonl"
+        logger = JsonlAuditLogger(log_file)
+        for i in range(3):
+            logger.log(_entry(request_id=f"r{i}"))
+        assert audit_query.count_entries(log_file) == 3
+
+        logger.log(_entry(request_id="r3"))
+        assert audit_query.count_entries(log_file) == 4
+
+        log_file.write_bytes(b"")
+        logger.log(_entry(request_id="r4"))
+        assert audit_query.count_entries(log_file) == 1
+
+    def test_count_entries_after_rename_rotation(self, tmp_path: Path) -> None:
+        log_file = tmp_path / "audit.jsonl"
+        logger = JsonlAuditLogger(log_file)
+        for i in range(3):
+            logger.log(_entry(request_id=f"old{i}"))
+        assert audit_query.count_entries(log_file) == 3
+
+        log_file.rename(tmp_path / "audit.jsonl.1")
+        # Longer lines, so the old byte offset falls mid-line in the new file
+        for i in range(5):
+            logger.log(_entry(request_id=f"new-request-{i}"))
+        assert audit_query.count_entries(log_file) == 5
+
+    async def test_stream_tail_batches(self, tmp_path: Path) -> None:
+        log_file = tmp_path / "audit.jsonl"
+        logger = JsonlAuditLogger(log_file)
+        logger.log(_entry(request_id="old"))
+
+        stream = audit_query.stream_tail_batches(log_file, poll_interval=0.01, max_batch=2)
+        first = asyncio.ensure_future(anext(stream))
+        await asyncio.sleep(0.02)
+        for i in range(3):
+            logger.log(_entry(request_id=f"r{i}"))
+
+        batches = [await first, await anext(stream)]
+        await stream.aclose()
+        assert [[e.request_id for e in b] for b in batches] == [["r0", "r1"], ["r2"]]
+
+    async def test_stream_tail_wakes_on_write(self, tmp_path: Path) -> None:
+        from runtime.audit.watch import FileWatch
+
+        log_file = tmp_path / "audit.jsonl"
+        logger = JsonlAuditLogger(log_file)
+        probe = FileWatch(log_file)
+        if not probe.active:
+            pytest.skip("inotify not available")
+        probe.close()
+
+        stream = audit_query.stream_tail_batches(log_file, poll_interval=30)
+        pending = asyncio.ensure_future(anext(stream))
+        await asyncio.sleep(0.05)
+        logger.log(_entry(request_id="live"))
+
+        batch = await asyncio.wait_for(pending, timeout=2)
+        await stream.aclose()
+        assert [e.request_id for e in batch] == ["live"]
+
+    def test_read_all_parses_appends_incrementally(self, tmp_path: Path) -> None:
+        log_file = tmp_path / "audit.jsonl"
+        logger = JsonlAuditLogger(log_file)
+        logger.log(_entry(request_id="r0"))
+        assert [e.request_id for e in audit_query._read_all(log_file)] == ["r0"]
+
+        logger.log(_entry(request_id="r1"))
+        with log_file.open("ab") as f:
+            f.write(b'{"ts":')  # half-written line is held back
+        assert [e.request_id for e in audit_query._read_all(log_file)] == ["r0", "r1"]
+
+        log_file.write_bytes(b"")
+        logger.log(_entry(request_id="fresh"))
+        assert [e.request_id for e in audit_query._read_all(log_file)] == ["fresh"]
+
+    def test_read_all_cache_bounded(self, tmp_path: Path) -> None:
+        for i in range(audit_query._ENTRY_CACHE_LOGS + 3):
+            log_file = tmp_path / f"audit{i}.jsonl"
+            JsonlAuditLogger(log_file).log(_entry(request_id=f"r{i}"))
+            assert [e.request_id for e in audit_query._read_all(log_file)] == [f"r{i}"]
+        assert len(audit_query._ENTRY_CACHE) <= audit_query._ENTRY_CACHE_LOGS
+
+    def test_read_all_concurrent_readers(self, tmp_path: Path) -> None:
+        from concurrent.futures import ThreadPoolExecutor
+
+        log_file = tmp_path / "audit.jsonl"
+        logger = JsonlAuditLogger(log_file)
+        for i in range(50):
+            logger.log(_entry(request_id=f"r{i}"))
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(lambda _: len(audit_query._read_all(log_file)), range(32)))
+        assert results == [50] * 32
+
     def test_missing_file_returns_empty(self, tmp_path: Path) -> None:
         log_file = tmp_path / "nonexistent.jsonl"
         assert audit_query.tail(log_file, 5) == []
         assert audit_query.query_by_request(log_file, "x") == []
         assert audit_query.query_by_event(log_file, AuditEvent.TOOL_CALL) == []
+
+
+# ── event index tests ───────────────────────────────────────────────
+
+
+class TestEventIndex:
+    def test_index_catches_up_with_appends(self, tmp_path: Path) -> None:
+        log_file = tmp_path / "audit.jsonl"
+        logger = JsonlAuditLogger(log_file)
+        logger.log(_entry(request_id="r1", event=AuditEvent.TOOL_CALL))
+        assert len(logger.query_by_event(AuditEvent.TOOL_CALL)) == 1
+        assert (tmp_path / "audit.jsonl.idx").exists()
+
+        logger.log(_entry(request_id="r2", event=AuditEvent.REQUEST_END))
+        logger.log(_entry(request_id="r3", event=AuditEvent.TOOL_CALL))
+        results = logger.query_by_event(AuditEvent.TOOL_CALL)
+        assert [e.request_id for e in results] == ["r1", "r3"]
+
+    def test_index_rebuilt_after_truncation(self, tmp_path: Path) -> None:
+        log_file = tmp_path / "audit.jsonl"
+        logger = JsonlAuditLogger(log_file)
+        for i in range(3):
+            logger.log(_entry(request_id=f"r{i}", event=AuditEvent.TOOL_CALL))
+        assert len(audit_query.query_by_event(log_file, AuditEvent.TOOL_CALL)) == 3
+
+        log_file.write_bytes(b"")
+        logger.log(_entry(request_id="new", event=AuditEvent.TOOL_CALL))
+        results = audit_query.query_by_event(log_file, AuditEvent.TOOL_CALL)
+        assert [e.request_id for e in results] == ["new"]
+
+    def test_index_rebuilt_after_rename_rotation(self, tmp_path: Path) -> None:
+        log_file = tmp_path / "audit.jsonl"
+        logger = JsonlAuditLogger(log_file)
+        for i in range(3):
+            logger.log(_entry(request_id=f"old{i}", event=AuditEvent.TOOL_RESULT))
+        assert len(audit_query.query_by_event(log_file, AuditEvent.TOOL_RESULT)) == 3
+
+        log_file.rename(tmp_path / "audit.jsonl.1")
+        for i in range(4):
+            logger.log(_entry(request_id=f"new{i}", event=AuditEvent.REQUEST_END))
+        assert audit_query.query_by_event(log_file, AuditEvent.TOOL_RESULT) == []
+        results = audit_query.query_by_event(log_file, AuditEvent.REQUEST_END)
+        assert [e.request_id for e in results] == ["new0", "new1", "new2", "new3"]
+
+    def test_index_rebuilt_when_event_list_changes(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        import runtime.audit.index as index_mod
+
+        log_file = tmp_path / "audit.jsonl"
+        logger = JsonlAuditLogger(log_file)
+        logger.log(_entry(request_id="r1", event=AuditEvent.TOOL_CALL))
+        audit_query.query_by_event(log_file, AuditEvent.TOOL_CALL)
+
+        # Same ids, different meaning: an index from the old list must not be reused
+        swapped = {e.value.encode(): i for i, e in enumerate(reversed(list(AuditEvent)))}
+        monkeypatch.setattr(index_mod, "_EVENT_IDS", swapped)
+        monkeypatch.setattr(index_mod, "_EVENTS_DIGEST", b"otherver")
+        results = audit_query.query_by_event(log_file, AuditEvent.TOOL_CALL)
+        assert [e.request_id for e in results] == ["r1"]
+
+    def test_index_updated_in_place(self, tmp_path: Path) -> None:
+        log_file = tmp_path / "audit.jsonl"
+        idx_file = tmp_path / "audit.jsonl.idx"
+        logger = JsonlAuditLogger(log_file)
+        logger.log(_entry(request_id="r1", event=AuditEvent.TOOL_CALL))
+        audit_query.query_by_event(log_file, AuditEvent.TOOL_CALL)
+        ino = idx_file.stat().st_ino
+
+        logger.log(_entry(request_id="r2", event=AuditEvent.TOOL_CALL))
+        assert len(audit_query.query_by_event(log_file, AuditEvent.TOOL_CALL)) == 2
+        assert idx_file.stat().st_ino == ino
+
+    def test_concurrent_refreshes_agree(self, tmp_path: Path) -> None:
+        from concurrent.futures import ThreadPoolExecutor
+
+        log_file = tmp_path / "audit.jsonl"
+        logger = JsonlAuditLogger(log_file)
+        for i in range(50):
+            logger.log(_entry(request_id=f"r{i}", event=AuditEvent.TOOL_CALL))
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(
+                lambda _: len(audit_query.query_by_event(log_file, AuditEvent.TOOL_CALL, limit=0)),
+                range(32),
+            ))
+        assert results == [50] * 32
+        assert not list(tmp_path.glob("*.tmp"))
+
+
+class TestRequestIndex:
+    def test_index_catches_up_with_appends(self, tmp_path: Path) -> None:
+        log_file = tmp_path / "audit.jsonl"
+        logger = JsonlAuditLogger(log_file)
+        logger.log(_entry(request_id="r1"))
+        logger.log(_entry(request_id="r2"))
+        assert len(logger.query_by_request("r1")) == 1
+        assert (tmp_path / "audit.jsonl.ridx").exists()
+
+        logger.log(_entry(request_id="r1", event=AuditEvent.REQUEST_END))
+        results = logger.query_by_request("r1")
+        assert [e.event for e in results] == [AuditEvent.REQUEST_START, AuditEvent.REQUEST_END]
+
+    def test_sidecar_reused_by_fresh_process(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        import runtime.audit.index as index_mod
+
+        log_file = tmp_path / "audit.jsonl"
+        logger = JsonlAuditLogger(log_file)
+        for i in range(3):
+            logger.log(_entry(request_id=f"r{i}"))
+        audit_query.query_by_request(log_file, "r0")
+
+        monkeypatch.setattr(index_mod, "_REQUEST_STATE", OrderedDict())
+        monkeypatch.setattr(index_mod, "_REQUEST_SPANS", OrderedDict())
+        logger.log(_entry(request_id="r1", event=AuditEvent.REQUEST_END))
+        assert len(audit_query.query_by_request(log_file, "r1")) == 2
+        header, *records = (tmp_path / "audit.jsonl.ridx").read_bytes().splitlines()
+        assert header.startswith(b"#")
+        assert len(records) == 4
+
+    def test_escaped_request_id(self, tmp_path: Path) -> None:
+        log_file = tmp_path / "audit.jsonl"
+        logger = JsonlAuditLogger(log_file)
+        logger.log(_entry(request_id='odd"id'))
+        logger.log(_entry(request_id="plain"))
+
+        assert [e.request_id for e in logger.query_by_request('odd"id')] == ['odd"id']
+        assert [e.request_id for e in logger.query_by_request("plain")] == ["plain"]
+
+    def test_index_rebuilt_after_truncation(self, tmp_path: Path) -> None:
+        log_file = tmp_path / "audit.jsonl"
+        logger = JsonlAuditLogger(log_file)
+        for i in range(3):
+            logger.log(_entry(request_id="r1"))
+        assert len(audit_query.query_by_request(log_file, "r1")) == 3
+
+        log_file.write_bytes(b"")
+        logger.log(_entry(request_id="r1", event=AuditEvent.REQUEST_END))
+        results = audit_query.query_by_request(log_file, "r1")
+        assert [e.event for e in results] == [AuditEvent.REQUEST_END]
+
+    def test_index_rebuilt_after_rename_rotation(self, tmp_path: Path) -> None:
+        log_file = tmp_path / "audit.jsonl"
+        logger = JsonlAuditLogger(log_file)
+        for i in range(3):
+            logger.log(_entry(request_id=f"old{i}"))
+        assert len(audit_query.query_by_request(log_file, "old0")) == 1
+
+        log_file.rename(tmp_path / "audit.jsonl.1")
+        for i in range(4):
+            logger.log(_entry(request_id=f"new{i}"))
+        for i in range(4):
+            assert [e.request_id for e in audit_query.query_by_request(log_file, f"new{i}")] == [f"new{i}"]
+        assert audit_query.query_by_request(log_file, "old0") == []
+        page, total = audit_query.query_filtered(log_file, request_id="new1")
+        assert total == 1 and page[0].request_id == "new1"
+
+    def test_span_cache_is_bounded(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        import runtime.audit.index as index_mod
+
+        monkeypatch.setattr(index_mod, "_REQUEST_SPANS_MAX", 4)
+        log_file = tmp_path / "audit.jsonl"
+        logger = JsonlAuditLogger(log_file)
+        for i in range(10):
+            logger.log(_entry(request_id=f"r{i}"))
+        for i in range(10):
+            assert [e.request_id for e in audit_query.query_by_request(log_file, f"r{i}")] == [f"r{i}"]
+        assert len(index_mod._REQUEST_SPANS) <= 4
+
+        # Evicted ids are found again through the .ridx file
+        logger.log(_entry(request_id="r0", event=AuditEvent.REQUEST_END))
+        results = audit_query.query_by_request(log_file, "r0")
+        assert [e.event for e in results] == [AuditEvent.REQUEST_START, AuditEvent.REQUEST_END]
@@ -91,3 +91,24 @@ class TestOllamaEmbeddingAdapter:
         with patch("runtime.embedding_adapters.ollama.httpx.AsyncClient", return_value=mock_client):
             with pytest.raises(RuntimeError, match="Ollama embed request failed"):
                 await adapter.embed(["hello"])
+
+    @pytest.mark.asyncio
+    async def test_client_reused_across_calls(self) -> None:
+        adapter = OllamaEmbeddingAdapter()
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {"embeddings": [[0.1]]}
+
+        mock_client = AsyncMock()
+        mock_client.post.return_value = mock_response
+
+        with patch(
+            "runtime.embedding_adapters.ollama.httpx.AsyncClient", return_value=mock_client
+        ) as client_cls:
+            await adapter.embed(["a"])
+            await adapter.embed(["b"])
+            await adapter.aclose()
+
+        client_cls.assert_called_once()
+        assert mock_client.post.call_count == 2
+        mock_client.aclose.assert_awaited_once()
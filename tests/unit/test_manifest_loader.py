@@ -62,3 +62,47 @@ class TestManifestLoader:
         f.write_text("just a string")
         with pytest.raises(ValueError, match="YAML mapping"):
             load_manifest(str(f))
+
+    def test_cache_written_and_reused(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("DOMEKIT_MANIFEST_CACHE", "1")
+        f = tmp_path / "domekit.yaml"
+        f.write_text(SAMPLE_MANIFEST)
+        first = load_manifest(str(f))
+        assert (tmp_path / ".domekit" / "manifest.cache").exists()
+
+        second = load_manifest(str(f))
+        assert second == first
+
+    def test_cache_invalidated_on_change(self, tmp_path: Path) -> None:
+        f = tmp_path / "domekit.yaml"
+        f.write_text(SAMPLE_MANIFEST)
+        load_manifest(str(f))
+
+        f.write_text(SAMPLE_MANIFEST.replace("test-app", "other-app"))
+        assert load_manifest(str(f)).app.name == "other-app"
+
+    def test_same_size_same_mtime_edit_seen(self, tmp_path: Path) -> None:
+        import os
+
+        f = tmp_path / "domekit.yaml"
+        f.write_text(SAMPLE_MANIFEST)
+        st = f.stat()
+        load_manifest(str(f))
+
+        f.write_text(SAMPLE_MANIFEST.replace("sql_query", "sql_qvery"))
+        os.utime(f, ns=(st.st_atime_ns, st.st_mtime_ns))
+        assert "sql_qvery" in load_manifest(str(f)).policy.tools.allow
+
+    def test_file_cache_off_by_default(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.delenv("DOMEKIT_MANIFEST_CACHE", raising=False)
+        f = tmp_path / "domekit.yaml"
+        f.write_text(SAMPLE_MANIFEST)
+        load_manifest(str(f))
+        assert not (tmp_path / ".domekit").exists()
+
+    def test_callers_get_independent_copies(self, tmp_path: Path) -> None:
+        f = tmp_path / "domekit.yaml"
+        f.write_text(SAMPLE_MANIFEST)
+        first = load_manifest(str(f))
+        first.policy.tools.allow.append("write_file")
+        assert "write_file" not in load_manifest(str(f)).policy.tools.allow
@@ -99,6 +99,30 @@ class TestToolUsage:
         assert m["tool_usage"] == []
         path.unlink()
 
+    def test_picks_up_appended_entries(self):
+        path = _write_entries([
+            AuditEntry(request_id="r1", event=AuditEvent.TOOL_CALL, detail={"tool": "sql_query"}),
+        ])
+        assert compute_metrics(path)["tool_usage"] == [{"tool": "sql_query", "count": 1}]
+
+        with path.open("a") as f:
+            f.write('{"ts":"2026-01-01T00:00:00Z","request_id":"r2","event":"tool.call"}\n')
+        usage = {t["tool"]: t["count"] for t in compute_metrics(path)["tool_usage"]}
+        assert usage == {"sql_query": 1, "unknown": 1}
+        path.unlink()
+
+    def test_streams_lines_split_across_blocks(self, monkeypatch: pytest.MonkeyPatch):
+        import runtime.metrics as metrics_mod
+
+        monkeypatch.setattr(metrics_mod, "_READ_BLOCK", 50)
+        path = _write_entries([
+            AuditEntry(request_id=f"r{i}", event=AuditEvent.TOOL_CALL, detail={"tool": f"t{i % 2}"})
+            for i in range(7)
+        ])
+        usage = {t["tool"]: t["count"] for t in compute_metrics(path)["tool_usage"]}
+        assert usage == {"t0": 4, "t1": 3}
+        path.unlink()
+
 
 class TestErrorRates:
     def test_computes_block_rate(self):
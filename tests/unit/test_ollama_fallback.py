@@ -142,3 +142,33 @@ class TestOllamaFallbackParser:
         assert msg.tool_calls is not None
         assert msg.tool_calls[0].function.name == "sql_query"
         assert "db_path" in msg.tool_calls[0].function.arguments
+
+
+class TestExtractToolCallFromText:
+    """Prompt-based tool calls embedded in free text."""
+
+    def test_bare_tool_call_with_nested_arguments(self) -> None:
+        from runtime.model_adapters.ollama import _extract_tool_call_from_text
+
+        content = (
+            'Let me check. {"tool_call": {"name": "sql_query", '
+            '"arguments": {"query": "SELECT \'}\' FROM t", "opts": {"limit": 5}}}} done'
+        )
+        tc, remaining = _extract_tool_call_from_text(content)
+        assert tc is not None
+        assert tc.function.name == "sql_query"
+        assert '"limit": 5' in tc.function.arguments
+        assert remaining == "Let me check."
+
+    def test_fenced_json_block(self) -> None:
+        from runtime.model_adapters.ollama import _extract_tool_call_from_text
+
+        content = 'Sure.\n```json\n{"tool_call": {"name": "read_file", "arguments": {"path": "a.txt"}}}\n```'
+        tc, remaining = _extract_tool_call_from_text(content)
+        assert tc is not None and tc.function.name == "read_file"
+        assert remaining == "Sure."
+
+    def test_no_tool_call(self) -> None:
+        from runtime.model_adapters.ollama import _extract_tool_call_from_text
+
+        assert _extract_tool_call_from_text("just text {not json}") == (None, "just text {not json}")
@@ -102,6 +102,12 @@ class TestDataAccessPolicy:
         decision = engine.check_data_access("data/report.csv", "read")
         assert decision.verdict == PolicyVerdict.ALLOW
 
+    def test_fs_read_reports_first_matching_pattern(self) -> None:
+        engine = DomeKitPolicyEngine()
+        engine.load_manifest(_make_manifest(fs_read=["logs/*.txt", "data/*.csv", "data/*"]))
+        decision = engine.check_data_access("data/report.csv", "read")
+        assert decision.reason == "Path 'data/report.csv' matches read pattern 'data/*.csv'"
+
     def test_deny_fs_read_no_match(self) -> None:
         engine = DomeKitPolicyEngine()
         engine.load_manifest(_make_manifest(fs_read=["data/*.csv"]))
@@ -5,6 +5,7 @@ from __future__ import annotations
 import json
 import os
 import tempfile
+import uuid
 from typing import Any
 from unittest.mock import AsyncMock, patch
 
@@ -131,6 +132,27 @@ class TestOllamaAdapter:
         assert len(msg.tool_calls) == 1
         assert msg.tool_calls[0].function.name == "sql_query"
 
+    @pytest.mark.asyncio
+    async def test_chat_sends_pre_serialized_tools(self) -> None:
+        import httpx
+
+        bodies: list[bytes] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            bodies.append(request.content)
+            return httpx.Response(200, json={"message": {"role": "assistant", "content": "hi"}})
+
+        tools = create_default_registry().get_openai_definitions()
+        adapter = OllamaAdapter()
+        adapter._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        messages = [Message(role=Role.USER, content="hé")]
+        await adapter.chat(messages, "llama3", tools=tools)
+        await adapter.chat(messages, "llama3", tools=tools, tools_json=json.dumps(tools).encode())
+        await adapter.aclose()
+
+        assert json.loads(bodies[0]) == json.loads(bodies[1])
+        assert json.loads(bodies[1])["tools"] == tools
+
 
 # ── Test: tool router ───────────────────────────────────────────────
 
@@ -162,6 +184,13 @@ class TestToolRouter:
             "audit_path": audit_path,
         }
 
+    def test_request_ids_unique_across_pool_refills(self) -> None:
+        from runtime.tool_router import _ID_POOL_SIZE, _new_request_id
+
+        ids = [_new_request_id() for _ in range(3 * _ID_POOL_SIZE // 16)]
+        assert len(set(ids)) == len(ids)
+        assert all(uuid.UUID(i).version == 4 for i in ids)
+
     @pytest.mark.asyncio
     async def test_simple_chat(self, setup: dict[str, Any]) -> None:
         """Model returns content, no tool calls."""
@@ -179,6 +208,8 @@ class TestToolRouter:
         assert response.choices[0].message.content == "Hi there!"
         assert response.trace is not None
         assert response.trace.tools_used == []
+        assert str(uuid.UUID(response.id)) == response.id
+        assert uuid.UUID(response.id).version == 4
 
     @pytest.mark.asyncio
     async def test_tool_calling_loop(self, setup: dict[str, Any]) -> None:
@@ -334,6 +365,169 @@ class TestToolRouter:
         # The response should still have tool_calls (never got plain content)
         assert response.choices[0].message.tool_calls is not None
 
+    @pytest.mark.asyncio
+    async def test_tool_calls_run_concurrently(self, setup: dict[str, Any]) -> None:
+        """Read-only calls from one model turn run together; replies keep call order."""
+        import asyncio
+
+        router: ToolRouter = setup["router"]
+        manifest = setup["manifest"]
+
+        tool_response = Message(
+            role=Role.ASSISTANT,
+            tool_calls=[
+                ToolCall(
+                    id=f"call_{i}",
+                    function=ToolCallFunction(name="read_file", arguments=f'{{"path": "/tmp/{i}"}}'),
+                )
+                for i in range(2)
+            ],
+        )
+        final_response = Message(role=Role.ASSISTANT, content="done")
+        barrier = asyncio.Barrier(2)
+
+        async def fake_run(self: Any, ctx: ToolContext, args: dict[str, Any]) -> ToolOutput:
+            # Deadlocks (and times out) if the calls run one after another
+            await asyncio.wait_for(barrier.wait(), timeout=2)
+            return ToolOutput(call_id="", tool_name="read_file", result=args["path"])
+
+        mock_chat = AsyncMock(side_effect=[tool_response, final_response])
+        with patch.object(setup["adapter"], "chat", mock_chat):
+            with patch("runtime.tools.read_file.ReadFileTool.run", fake_run):
+                request = ChatRequest(messages=[Message(role=Role.USER, content="read")])
+                response = await router.run(request, manifest)
+
+        assert response.trace.tools_used == ["read_file", "read_file"]
+        tool_msgs = [m for m in mock_chat.call_args_list[1].args[0] if m.role == Role.TOOL]
+        assert [m.tool_call_id for m in tool_msgs] == ["call_0", "call_1"]
+        assert [json.loads(m.content)["result"] for m in tool_msgs] == ["/tmp/0", "/tmp/1"]
+
+    @pytest.mark.asyncio
+    async def test_batch_calls_logged_before_they_run(self, setup: dict[str, Any]) -> None:
+        """Every call in a concurrent batch has its tool.call entry before any starts."""
+        router: ToolRouter = setup["router"]
+        manifest = setup["manifest"]
+
+        tool_response = Message(
+            role=Role.ASSISTANT,
+            tool_calls=[
+                ToolCall(
+                    id=f"call_{i}",
+                    function=ToolCallFunction(name="read_file", arguments=f'{{"path": "/tmp/{i}"}}'),
+                )
+                for i in range(3)
+            ],
+        )
+        final_response = Message(role=Role.ASSISTANT, content="done")
+        logged_at_start: list[int] = []
+
+        async def fake_run(self: Any, ctx: ToolContext, args: dict[str, Any]) -> ToolOutput:
+            calls = setup["logger"].query_by_request(ctx.request_id)
+            logged_at_start.append(sum(e.event == AuditEvent.TOOL_CALL for e in calls))
+            return ToolOutput(call_id="", tool_name="read_file", result=args["path"])
+
+        mock_chat = AsyncMock(side_effect=[tool_response, final_response])
+        with patch.object(setup["adapter"], "chat", mock_chat):
+            with patch("runtime.tools.read_file.ReadFileTool.run", fake_run):
+                request = ChatRequest(messages=[Message(role=Role.USER, content="read")])
+                await router.run(request, manifest)
+
+        assert logged_at_start == [3, 3, 3]
+
+    @pytest.mark.asyncio
+    async def test_write_finishes_before_later_read(self, setup: dict[str, Any]) -> None:
+        """A call that may write runs alone; audit entries pair each call with its result."""
+        import asyncio
+
+        router: ToolRouter = setup["router"]
+        manifest = setup["manifest"]
+
+        tool_response = Message(
+            role=Role.ASSISTANT,
+            tool_calls=[
+                ToolCall(
+                    id="call_0",
+                    function=ToolCallFunction(name="write_file", arguments='{"path": "/tmp/x", "content": "hi"}'),
+                ),
+                ToolCall(
+                    id="call_1",
+                    function=ToolCallFunction(name="read_file", arguments='{"path": "/tmp/x"}'),
+                ),
+            ],
+        )
+        final_response = Message(role=Role.ASSISTANT, content="done")
+        order: list[str] = []
+
+        async def fake_write(self: Any, ctx: ToolContext, args: dict[str, Any]) -> ToolOutput:
+            order.append("write start")
+            await asyncio.sleep(0.01)
+            order.append("write end")
+            return ToolOutput(call_id="", tool_name="write_file", result="ok")
+
+        async def fake_read(self: Any, ctx: ToolContext, args: dict[str, Any]) -> ToolOutput:
+            order.append("read")
+            return ToolOutput(call_id="", tool_name="read_file", result="hi")
+
+        mock_chat = AsyncMock(side_effect=[tool_response, final_response])
+        with patch.object(setup["adapter"], "chat", mock_chat), \
+                patch("runtime.tools.write_file.WriteFileTool.run", fake_write), \
+                patch("runtime.tools.read_file.ReadFileTool.run", fake_read):
+            request = ChatRequest(messages=[Message(role=Role.USER, content="write then read")])
+            response = await router.run(request, manifest)
+
+        assert order == ["write start", "write end", "read"]
+        entries = setup["logger"].query_by_request(response.trace.request_id)
+        tool_events = [
+            (e.event, e.detail.get("tool"))
+            for e in entries
+            if e.event in (AuditEvent.TOOL_CALL, AuditEvent.TOOL_RESULT)
+        ]
+        assert tool_events == [
+            (AuditEvent.TOOL_CALL, "write_file"),
+            (AuditEvent.TOOL_RESULT, "write_file"),
+            (AuditEvent.TOOL_CALL, "read_file"),
+            (AuditEvent.TOOL_RESULT, "read_file"),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_tool_context_data_paths_reused(self, setup: dict[str, Any]) -> None:
+        """Data paths are collected once per manifest and are read-only."""
+        router: ToolRouter = setup["router"]
+        manifest = setup["manifest"]
+
+        tool_response = Message(
+            role=Role.ASSISTANT,
+            tool_calls=[
+                ToolCall(
+                    id="call_0",
+                    function=ToolCallFunction(
+                        name="read_file",
+                        arguments='{"path": "/tmp/x.txt"}',
+                    ),
+                )
+            ],
+        )
+        final_response = Message(role=Role.ASSISTANT, content="done")
+        seen: list[ToolContext] = []
+
+        async def fake_run(self: Any, ctx: ToolContext, args: dict[str, Any]) -> ToolOutput:
+            seen.append(ctx)
+            return ToolOutput(call_id="call_0", tool_name="read_file", result="data")
+
+        mock_chat = AsyncMock(side_effect=[tool_response, final_response] * 2)
+        with patch.object(setup["adapter"], "chat", mock_chat):
+            with patch("runtime.tools.read_file.ReadFileTool.run", fake_run):
+                for _ in range(2):
+                    request = ChatRequest(messages=[Message(role=Role.USER, content="read")])
+                    await router.run(request, manifest)
+
+        assert len(seen) == 2
+        assert seen[0].request_id != seen[1].request_id
+        assert seen[0].manifest_data_paths is seen[1].manifest_data_paths
+        assert seen[0].manifest_data_paths["max_rows"] == 100
+        with pytest.raises(TypeError):
+            seen[0].manifest_data_paths["max_rows"] = 1  # type: ignore[index]
+
 
 # ── Test: FastAPI app integration ────────────────────────────────────
 
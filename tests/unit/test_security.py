@@ -116,6 +116,17 @@ class TestSqlInjection:
         assert len(alerts) == 0
         path.unlink()
 
+    def test_repeated_payload_alerts_every_entry(self):
+        detail = {"tool": "sql_query", "arguments": {"query": "DROP TABLE users"}}
+        entries = [
+            AuditEntry(request_id=f"r{i}", event=AuditEvent.TOOL_CALL, detail=detail)
+            for i in range(5)
+        ]
+        path = _write_entries(entries)
+        alerts = [a for a in detect_alerts(path) if a["type"] == "sql_injection"]
+        assert sorted(a["request_id"] for a in alerts) == [f"r{i}" for i in range(5)]
+        path.unlink()
+
 
 class TestBurstDenial:
     def test_detects_burst(self):
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import json
 import sqlite3
 import textwrap
 from pathlib import Path
@@ -9,7 +10,7 @@ from pathlib import Path
 import pytest
 
 from contracts.tool_sdk import BaseTool, ToolContext, ToolDefinition, ToolOutput
-from runtime.tools.base import validate_args
+from runtime.tools.base import matches_any, validate_args
 from runtime.tools.registry import ToolRegistry, create_default_registry
 from runtime.tools.sql_query import SqlQueryTool
 from runtime.tools.read_file import ReadFileTool
@@ -72,6 +73,45 @@ class TestToolRegistry:
             assert "description" in func
             assert "parameters" in func
 
+    def test_openai_definitions_cached_until_register(self) -> None:
+        reg = ToolRegistry()
+        reg.register(SqlQueryTool())
+        defs = reg.get_openai_definitions()
+        assert reg.get_openai_definitions() is defs
+
+        blob = reg.get_openai_definitions_json()
+        assert reg.get_openai_definitions_json() is blob
+        assert json.loads(blob) == defs
+
+        reg.register(ReadFileTool())
+        assert len(reg.get_openai_definitions()) == 2
+        assert len(json.loads(reg.get_openai_definitions_json())) == 2
+
+
+# ── matches_any tests ───────────────────────────────────────────────
+
+
+class TestMatchesAny:
+    def test_agrees_with_fnmatch(self) -> None:
+        import fnmatch
+
+        patterns = ["notes", "data/*", "v?c", "[ab]*"]
+        for name in ["notes", "data/x", "vec", "vc", "apple", "other", ""]:
+            expected = any(fnmatch.fnmatch(name, p) for p in patterns)
+            assert matches_any(name, patterns) is expected
+
+    def test_empty_allow_list(self) -> None:
+        assert not matches_any("", [])
+        assert not matches_any("anything", [])
+
+    def test_agrees_with_policy_globs(self) -> None:
+        from runtime.globs import compile_globs, first_match
+
+        patterns = ["data/*.csv", "out/**", "x?z"]
+        globs = compile_globs(patterns)
+        for name in ["data/a.csv", "data/a.csv.bak", "out/a/b", "xyz", "xz", "other"]:
+            assert matches_any(name, patterns) is (first_match(globs, name) is not None)
+
 
 # ── validate_args tests ─────────────────────────────────────────────
 
@@ -88,6 +128,20 @@ class TestValidateArgs:
         with pytest.raises(jsonschema.ValidationError):
             validate_args(tool, {"not_a_field": 123})
 
+    def test_schema_compiled_once_per_tool(self) -> None:
+        calls = 0
+
+        class CountingTool(ReadFileTool):
+            def definition(self) -> ToolDefinition:
+                nonlocal calls
+                calls += 1
+                return super().definition()
+
+        tool = CountingTool()
+        for _ in range(3):
+            validate_args(tool, {"path": "/tmp/test.txt"})
+        assert calls == 1
+
 
 # ── sql_query tool tests ────────────────────────────────────────────
 
@@ -138,6 +192,59 @@ class TestSqlQueryTool:
         assert not out.success
         assert out.error  # sqlite read-only error
 
+    @pytest.mark.asyncio
+    async def test_attach_cannot_leak_into_later_calls(self, db_path: str, tmp_path: Path) -> None:
+        other = tmp_path / "secret.db"
+        conn = sqlite3.connect(str(other))
+        conn.execute("CREATE TABLE secret (v TEXT)")
+        conn.execute("INSERT INTO secret VALUES ('s3cr3t')")
+        conn.commit()
+        conn.close()
+
+        ctx = _make_ctx(sqlite_allow=[db_path])
+        tool = SqlQueryTool()
+        out = await tool.run(ctx, {"db_path": db_path, "query": f"ATTACH DATABASE '{other}' AS x"})
+        assert not out.success
+
+        out = await tool.run(ctx, {"db_path": db_path, "query": "SELECT * FROM x.secret"})
+        assert not out.success
+        assert "s3cr3t" not in str(out.result)
+
+    @pytest.mark.asyncio
+    async def test_schema_pragmas_allowed(self, db_path: str) -> None:
+        ctx = _make_ctx(sqlite_allow=[db_path])
+        tool = SqlQueryTool()
+        out = await tool.run(ctx, {"db_path": db_path, "query": "PRAGMA table_info(t)"})
+        assert out.success
+        assert [row[1] for row in out.result["rows"]] == ["id", "val"]
+
+        out = await tool.run(ctx, {"db_path": db_path, "query": "PRAGMA query_only = 0"})
+        assert not out.success
+
+    @pytest.mark.asyncio
+    async def test_connection_reused_until_file_replaced(self, db_path: str, tmp_path: Path) -> None:
+        from runtime.tools import sql_query
+
+        ctx = _make_ctx(sqlite_allow=[db_path])
+        tool = SqlQueryTool()
+        query = {"db_path": db_path, "query": "SELECT count(*) FROM t"}
+        await tool.run(ctx, query)
+        idle = sql_query._IDLE[str(Path(db_path).resolve())]
+        first = idle[-1][0]
+        await tool.run(ctx, query)
+        assert idle[-1][0] is first
+
+        other = tmp_path / "other.db"
+        conn = sqlite3.connect(str(other))
+        conn.execute("CREATE TABLE t (id INTEGER PRIMARY KEY, val TEXT)")
+        conn.commit()
+        conn.close()
+        other.replace(db_path)
+
+        out = await tool.run(ctx, query)
+        assert out.result["rows"] == [(0,)]
+        assert idle[-1][0] is not first
+
 
 # ── read_file tool tests ────────────────────────────────────────────
 
@@ -153,6 +260,21 @@ class TestReadFileTool:
         assert out.success
         assert out.result == "hello world"
 
+    @pytest.mark.asyncio
+    async def test_uses_pre_resolved_prefixes(self, tmp_path: Path) -> None:
+        f = tmp_path / "hello.txt"
+        f.write_text("hello world")
+        # The resolved list wins over the raw one when both are present
+        ctx = ToolContext(
+            request_id="test-req-1",
+            manifest_data_paths={
+                "fs_allow_read": ["/some/other/prefix"],
+                "fs_allow_read_resolved": (str(tmp_path.resolve()),),
+            },
+        )
+        out = await ReadFileTool().run(ctx, {"path": str(f)})
+        assert out.success
+
     @pytest.mark.asyncio
     async def test_path_traversal_blocked(self, tmp_path: Path) -> None:
         f = tmp_path / "hello.txt"
@@ -173,6 +295,17 @@ class TestReadFileTool:
         assert not out.success
         assert "not allowed" in out.error
 
+    @pytest.mark.asyncio
+    async def test_sibling_with_prefix_name_blocked(self, tmp_path: Path) -> None:
+        (tmp_path / "data").mkdir()
+        secrets = tmp_path / "data-secrets"
+        secrets.mkdir()
+        (secrets / "key.txt").write_text("secret")
+        ctx = _make_ctx(fs_allow_read=[str(tmp_path / "data")])
+        out = await ReadFileTool().run(ctx, {"path": str(secrets / "key.txt")})
+        assert not out.success
+        assert "not allowed" in out.error
+
     @pytest.mark.asyncio
     async def test_max_bytes(self, tmp_path: Path) -> None:
         f = tmp_path / "big.txt"
@@ -221,3 +354,17 @@ class TestWriteFileTool:
         out = await tool.run(ctx, {"path": str(target), "content": "A" * 100})
         assert not out.success
         assert "max_bytes" in out.error
+
+    @pytest.mark.asyncio
+    async def test_max_bytes_counts_utf8_bytes(self, tmp_path: Path) -> None:
+        target = tmp_path / "multi.txt"
+        ctx = _make_ctx(fs_allow_write=[str(tmp_path)], max_bytes=6)
+        tool = WriteFileTool()
+        out = await tool.run(ctx, {"path": str(target), "content": "héé"})
+        assert out.success
+        assert out.result["bytes_written"] == 5
+        assert target.read_bytes() == "héé".encode()
+
+        out = await tool.run(ctx, {"path": str(target), "content": "éééé"})
+        assert not out.success
+        assert "max_bytes" in out.error
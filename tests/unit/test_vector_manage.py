@@ -70,6 +70,75 @@ class TestVectorManageTool:
         assert output.result["operation"] == "insert"
         assert output.result["count"] == 1
 
+    @pytest.mark.asyncio
+    async def test_auto_embedding_cached_by_text(self) -> None:
+        emb = _mock_embedding()
+        emb.embed.side_effect = lambda texts: [[float(len(t))] for t in texts]
+        vec = _mock_vector_db()
+        tool = VectorManageTool(embedding_adapter=emb, vector_adapter=vec)
+        ctx = _make_ctx(vector_allow_write=["col"])
+
+        await tool.run(ctx, {
+            "collection": "col",
+            "operation": "insert",
+            "documents": [{"text": "a"}, {"text": "bb"}, {"text": "a"}],
+        })
+        emb.embed.assert_called_once_with(["a", "bb"])
+
+        await tool.run(ctx, {
+            "collection": "col",
+            "operation": "insert",
+            "documents": [{"text": "bb"}, {"text": "ccc"}],
+        })
+        assert emb.embed.call_args.args == (["ccc"],)
+        docs = vec.insert.call_args.args[1]
+        assert [d.embedding for d in docs] == [[2.0], [3.0]]
+
+    @pytest.mark.asyncio
+    async def test_large_insert_split_into_chunks(self) -> None:
+        from runtime.tools.vector_manage import _INSERT_CHUNK_SIZE
+
+        vec = _mock_vector_db()
+        vec.insert.side_effect = lambda collection, docs: [d.id for d in docs]
+        tool = VectorManageTool(vector_adapter=vec)
+        ctx = _make_ctx(vector_allow_write=["col"])
+        n = 2 * _INSERT_CHUNK_SIZE + 1
+
+        output = await tool.run(ctx, {
+            "collection": "col",
+            "operation": "insert",
+            "documents": [{"id": str(i), "text": "t", "embedding": [0.1]} for i in range(n)],
+        })
+
+        assert output.success
+        assert vec.insert.call_count == 3
+        assert output.result["ids"] == [str(i) for i in range(n)]
+
+    @pytest.mark.asyncio
+    async def test_failed_chunk_rolls_back_written_chunks(self) -> None:
+        from runtime.tools.vector_manage import _INSERT_CHUNK_SIZE
+
+        def insert(collection: str, docs: list) -> list[str]:
+            if docs[0].id == str(2 * _INSERT_CHUNK_SIZE):
+                raise RuntimeError("disk full")
+            return [d.id for d in docs]
+
+        vec = _mock_vector_db()
+        vec.insert.side_effect = insert
+        tool = VectorManageTool(vector_adapter=vec)
+        ctx = _make_ctx(vector_allow_write=["col"])
+        n = 2 * _INSERT_CHUNK_SIZE + 1
+
+        output = await tool.run(ctx, {
+            "collection": "col",
+            "operation": "insert",
+            "documents": [{"id": str(i), "text": "t", "embedding": [0.1]} for i in range(n)],
+        })
+
+        assert not output.success
+        assert "disk full" in output.error
+        vec.delete.assert_called_once_with("col", [str(i) for i in range(2 * _INSERT_CHUNK_SIZE)])
+
     @pytest.mark.asyncio
     async def test_insert_with_precomputed_embedding(self) -> None:
         emb = _mock_embedding()
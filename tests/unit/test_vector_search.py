@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from unittest.mock import AsyncMock
 
 import pytest
@@ -69,6 +70,36 @@ class TestVectorSearchTool:
         vec.search.assert_called_once()
         assert output.result["count"] == 1
 
+    @pytest.mark.asyncio
+    async def test_concurrent_queries_share_one_embed_call(self) -> None:
+        emb = _mock_embedding()
+        emb.embed.side_effect = lambda texts: [[float(len(t))] for t in texts]
+        vec = _mock_vector_db()
+        tool = VectorSearchTool(embedding_adapter=emb, vector_adapter=vec)
+        ctx = _make_ctx(vector_allow=["col"])
+
+        outputs = await asyncio.gather(*(
+            tool.run(ctx, {"collection": "col", "query": q}) for q in ["a", "bb", "ccc"]
+        ))
+
+        assert all(o.success for o in outputs)
+        emb.embed.assert_called_once_with(["a", "bb", "ccc"])
+        vectors = sorted(c.kwargs["query_vector"] for c in vec.search.call_args_list)
+        assert vectors == [[1.0], [2.0], [3.0]]
+
+    @pytest.mark.asyncio
+    async def test_batched_embed_failure_reported_to_each_query(self) -> None:
+        emb = _mock_embedding()
+        emb.embed.side_effect = RuntimeError("ollama down")
+        tool = VectorSearchTool(embedding_adapter=emb, vector_adapter=_mock_vector_db())
+        ctx = _make_ctx(vector_allow=["col"])
+
+        outputs = await asyncio.gather(*(
+            tool.run(ctx, {"collection": "col", "query": q}) for q in ["a", "b"]
+        ))
+
+        assert [o.error for o in outputs] == ["Embedding failed: ollama down"] * 2
+
     @pytest.mark.asyncio
     async def test_raw_vector_search(self) -> None:
         vec = _mock_vector_db()